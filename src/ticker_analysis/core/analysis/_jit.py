@@ -0,0 +1,32 @@
+"""
+JIT Compilation Helpers
+
+This module wraps the optional Numba dependency for the analysis kernels.
+Kernels are compiled with Numba when it is installed and run as plain
+Python otherwise.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional
+    njit = None
+    prange = range
+
+
+# Whether kernels decorated with tjit are actually compiled
+NUMBA_AVAILABLE = njit is not None
+
+
+def tjit(*args, **kwargs):
+    """
+    JIT-compile a function with Numba if available.
+
+    Falls back to returning the function unchanged, so decorated kernels
+    behave identically with or without Numba installed. Passing an explicit
+    signature makes Numba compile eagerly at import time.
+    """
+    if njit is not None:
+        return njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
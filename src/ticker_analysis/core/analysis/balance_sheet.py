@@ -10,12 +10,14 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+import numpy as np
 from ..data.fetchers.balance_sheet import BalanceSheetData
 from ..data.enums import DataFrequency
-from .income_statement import FinancialHealthRating, TrendDirection
+from .income_statement import FinancialHealthRating, TrendDirection, _DATACLASS_OPTIONS, _TREND_CODES
+from ._jit import tjit, NUMBA_AVAILABLE
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BalanceSheetMetrics:
     """
     Dataclass representing key metrics extracted from the latest quarterly balance sheet.
@@ -54,7 +56,7 @@ class BalanceSheetMetrics:
     cash_assets_pct: Optional[float] = None         # Cash / Total Assets
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class YearlyBalanceSheetData:
     """
     Dataclass representing balance sheet data for a specific year.
@@ -70,7 +72,7 @@ class YearlyBalanceSheetData:
     tangible_book_value: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BalanceSheetTrendAnalysis:
     """
     Dataclass representing comprehensive balance sheet trend analysis over multiple years.
@@ -118,7 +120,7 @@ class BalanceSheetTrendAnalysis:
             self.current_ratio_trend = []
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BalanceSheetHealthAssessment:
     """
     Dataclass representing comprehensive balance sheet health assessment.
@@ -161,6 +163,117 @@ class BalanceSheetHealthAssessment:
             self.concerns = []
 
 
+# Explicit signature so Numba compiles (or loads from cache) at import time
+# rather than on the first analyzed ticker
+@tjit(
+    'void(float64[:, :], boolean[:, :], float64[:], float64[:, :], int64[:], float64[:], int8[:], float64[:])',
+    cache=True
+)
+def _trend_kernel(values, present, debt_to_equity, out_growth, out_counts, out_avgs, out_trends, out_scores):
+    """
+    Compute yearly balance sheet trend statistics in one pass.
+    
+    Follows the arithmetic order and the min/max comparisons of the per-list
+    helpers of BalanceSheetAnalyzer, so results match them exactly, NaN
+    inputs included. Only used when Numba is installed; as plain Python the
+    list helpers are faster.
+    
+    Args:
+        values: (3, years) array of total assets, equity and debt, oldest year first
+        present: (3, years) mask of the values that are not None
+        debt_to_equity: Debt-to-equity ratios of the years that have one
+        out_growth: (3, years - 1) output of growth rates, packed to the left
+        out_counts: (3,) output of the number of growth rates per metric
+        out_avgs: (3,) output of average growth rates (valid where count > 0)
+        out_trends: (3,) output of _TREND_CODES indices
+        out_scores: (2,) output of balance sheet stability and leverage
+            consistency scores (NaN if fewer than 2 values)
+    """
+    n_metrics, n_years = values.shape
+    count_all = 0
+    for m in range(n_metrics):
+        count = 0
+        total = 0.0
+        for j in range(1, n_years):
+            prev = values[m, j - 1]
+            curr = values[m, j]
+            # NaN values are present and propagate, like in the list helpers
+            if present[m, j - 1] and present[m, j] and prev != 0:
+                growth = ((curr - prev) / abs(prev)) * 100
+                out_growth[m, count] = growth
+                count += 1
+                total += growth
+        
+        avg = np.nan
+        trend = 0
+        if count > 0:
+            avg = total / count
+            vol = 0.0
+            if count >= 2:
+                variance = 0.0
+                for j in range(count):
+                    variance += (out_growth[m, j] - avg) ** 2
+                vol = (variance / count) ** 0.5
+            if vol > 25:
+                trend = 1
+            elif avg > 10:
+                trend = 5
+            elif avg > 3:
+                trend = 4
+            elif avg > -3:
+                trend = 3
+            else:
+                trend = 2
+        out_counts[m] = count
+        out_avgs[m] = avg
+        out_trends[m] = trend
+        count_all += count
+    
+    # Stability over all growth rates taken together, in metric order.
+    # Clamps spell out Python's min()/max() so NaN volatility scores 10.0
+    score = np.nan
+    if count_all >= 2:
+        total = 0.0
+        for m in range(n_metrics):
+            for j in range(out_counts[m]):
+                total += out_growth[m, j]
+        mean = total / count_all
+        variance = 0.0
+        for m in range(n_metrics):
+            for j in range(out_counts[m]):
+                variance += (out_growth[m, j] - mean) ** 2
+        penalty = ((variance / count_all) ** 0.5) / 5
+        if 8 < penalty:
+            penalty = 8.0
+        score = 10.0 - penalty
+        if not score < 10.0:
+            score = 10.0
+        if not score > 0.0:
+            score = 0.0
+    out_scores[0] = score
+    
+    # Leverage consistency from the volatility of debt-to-equity ratios
+    score = np.nan
+    n = debt_to_equity.size
+    if n >= 2:
+        total = 0.0
+        for j in range(n):
+            total += debt_to_equity[j]
+        mean = total / n
+        variance = 0.0
+        for j in range(n):
+            variance += (debt_to_equity[j] - mean) ** 2
+        penalty = ((variance / n) ** 0.5) / 2
+        if 8 < penalty:
+            penalty = 8.0
+        score = 10.0 - penalty
+        if not score < 10.0:
+            score = 10.0
+        if not score > 0.0:
+            score = 0.0
+    out_scores[1] = score
+
+
 class BalanceSheetAnalyzer:
     """
     Analyzer class for processing balance sheet data and generating comprehensive financial analysis.
@@ -278,31 +391,20 @@ class BalanceSheetAnalyzer:
                 tangible_book_value=year_data.tangible_book_value
             ))
         
-        # Calculate growth rates
-        assets_growth_rates = self._calculate_growth_rates([yd.total_assets for yd in yearly_balance_data])
-        equity_growth_rates = self._calculate_growth_rates([yd.total_equity for yd in yearly_balance_data])
-        debt_growth_rates = self._calculate_growth_rates([yd.total_debt for yd in yearly_balance_data])
-        
-        # Calculate average growth rates
-        avg_assets_growth = self._calculate_average(assets_growth_rates)
-        avg_equity_growth = self._calculate_average(equity_growth_rates)
-        avg_debt_growth = self._calculate_average(debt_growth_rates)
-        
-        # Assess trend directions
-        assets_trend = self._assess_trend_direction(assets_growth_rates, avg_assets_growth)
-        equity_trend = self._assess_trend_direction(equity_growth_rates, avg_equity_growth)
-        debt_trend = self._assess_trend_direction(debt_growth_rates, avg_debt_growth)
-        leverage_trend = self._assess_leverage_trend(debt_growth_rates, equity_growth_rates)
-        
         # Extract ratio trends
         debt_to_equity_trend = [yd.debt_to_equity for yd in yearly_balance_data if yd.debt_to_equity is not None]
         current_ratio_trend = [yd.current_ratio for yd in yearly_balance_data if yd.current_ratio is not None]
         
-        # Calculate stability scores
-        balance_sheet_stability_score = self._calculate_balance_sheet_stability_score(
-            assets_growth_rates, equity_growth_rates, debt_growth_rates
-        )
-        leverage_consistency_score = self._calculate_leverage_consistency_score(debt_to_equity_trend)
+        # Growth rates, averages, trend directions and stability scores. The
+        # kernel only pays off compiled; in plain Python the list helpers are faster
+        trend_statistics = self._trend_statistics_kernel if NUMBA_AVAILABLE else self._trend_statistics
+        (
+            (assets_growth_rates, equity_growth_rates, debt_growth_rates),
+            (avg_assets_growth, avg_equity_growth, avg_debt_growth),
+            (assets_trend, equity_trend, debt_trend),
+            (balance_sheet_stability_score, leverage_consistency_score)
+        ) = trend_statistics(yearly_balance_data, debt_to_equity_trend)
+        leverage_trend = self._assess_leverage_trend(debt_growth_rates, equity_growth_rates)
         
         return BalanceSheetTrendAnalysis(
             ticker=ticker,
@@ -325,6 +427,79 @@ class BalanceSheetAnalyzer:
             leverage_consistency_score=leverage_consistency_score
         )
     
+    def _trend_statistics(
+        self, 
+        yearly_balance_data: List[YearlyBalanceSheetData], 
+        debt_to_equity_trend: List[float]
+    ) -> Tuple[tuple, tuple, tuple, tuple]:
+        """
+        Compute growth rates, averages, trend directions and stability scores.
+        
+        Returns:
+            Tuples of (assets, equity, debt) growth rates, average growth rates and
+            trend directions, and the (stability, leverage consistency) scores
+        """
+        # Calculate growth rates
+        assets_growth_rates = self._calculate_growth_rates([yd.total_assets for yd in yearly_balance_data])
+        equity_growth_rates = self._calculate_growth_rates([yd.total_equity for yd in yearly_balance_data])
+        debt_growth_rates = self._calculate_growth_rates([yd.total_debt for yd in yearly_balance_data])
+        
+        # Calculate average growth rates
+        avg_assets_growth = self._calculate_average(assets_growth_rates)
+        avg_equity_growth = self._calculate_average(equity_growth_rates)
+        avg_debt_growth = self._calculate_average(debt_growth_rates)
+        
+        # Assess trend directions
+        assets_trend = self._assess_trend_direction(assets_growth_rates, avg_assets_growth)
+        equity_trend = self._assess_trend_direction(equity_growth_rates, avg_equity_growth)
+        debt_trend = self._assess_trend_direction(debt_growth_rates, avg_debt_growth)
+        
+        # Calculate stability scores
+        balance_sheet_stability_score = self._calculate_balance_sheet_stability_score(
+            assets_growth_rates, equity_growth_rates, debt_growth_rates
+        )
+        leverage_consistency_score = self._calculate_leverage_consistency_score(debt_to_equity_trend)
+        
+        return (
+            (assets_growth_rates, equity_growth_rates, debt_growth_rates),
+            (avg_assets_growth, avg_equity_growth, avg_debt_growth),
+            (assets_trend, equity_trend, debt_trend),
+            (balance_sheet_stability_score, leverage_consistency_score)
+        )
+    
+    def _trend_statistics_kernel(
+        self, 
+        yearly_balance_data: List[YearlyBalanceSheetData], 
+        debt_to_equity_trend: List[float]
+    ) -> Tuple[tuple, tuple, tuple, tuple]:
+        """Compute the same statistics as _trend_statistics with the compiled _trend_kernel."""
+        columns = [
+            [yd.total_assets for yd in yearly_balance_data],
+            [yd.total_equity for yd in yearly_balance_data],
+            [yd.total_debt for yd in yearly_balance_data],
+        ]
+        values = np.array([[np.nan if v is None else v for v in column] for column in columns], dtype=np.float64)
+        present = np.array([[v is not None for v in column] for column in columns])
+        n_years = len(yearly_balance_data)
+        out_growth = np.empty((3, n_years - 1))
+        out_counts = np.empty(3, dtype=np.int64)
+        out_avgs = np.empty(3)
+        out_trends = np.empty(3, dtype=np.int8)
+        out_scores = np.empty(2)
+        _trend_kernel(
+            values, present, np.array(debt_to_equity_trend, dtype=np.float64),
+            out_growth, out_counts, out_avgs, out_trends, out_scores
+        )
+        
+        counts = out_counts.tolist()
+        return (
+            tuple(out_growth[m, :count].tolist() for m, count in enumerate(counts)),
+            tuple(avg if count else None for avg, count in zip(out_avgs.tolist(), counts)),
+            tuple(_TREND_CODES[code] for code in out_trends.tolist()),
+            # Computed scores are clamped to [0, 10], so NaN only marks a missing score
+            tuple(None if score != score else score for score in out_scores.tolist())
+        )
+    
     def assess_balance_sheet_health(
         self, 
         metrics: Optional[BalanceSheetMetrics], 
@@ -500,28 +675,6 @@ class BalanceSheetAnalyzer:
         variance = sum((x - mean) ** 2 for x in values) / len(values)
         return variance ** 0.5
     
-    def _assess_leverage_trend(self, debt_growth_rates: List[float], equity_growth_rates: List[float]) -> TrendDirection:
-        """Assess leverage trend by comparing debt vs equity growth."""
-        if not debt_growth_rates or not equity_growth_rates:
-            return TrendDirection.INSUFFICIENT_DATA
-        
-        avg_debt_growth = self._calculate_average(debt_growth_rates)
-        avg_equity_growth = self._calculate_average(equity_growth_rates)
-        
-        if avg_debt_growth is None or avg_equity_growth is None:
-            return TrendDirection.INSUFFICIENT_DATA
-        
-        leverage_change = avg_debt_growth - avg_equity_growth
-        
-        if leverage_change > 10:  # Debt growing much faster than equity
-            return TrendDirection.DECLINING  # Worsening leverage
-        elif leverage_change > 3:
-            return TrendDirection.VOLATILE
-        elif leverage_change > -3:
-            return TrendDirection.STABLE
-        else:  # Equity growing faster than debt
-            return TrendDirection.MODERATE_GROWTH  # Improving leverage
-    
     def _calculate_balance_sheet_stability_score(
         self, 
         assets_growth: List[float], 
@@ -564,6 +717,28 @@ class BalanceSheetAnalyzer:
         
         return max(0.0, min(10.0, score))
     
+    def _assess_leverage_trend(self, debt_growth_rates: List[float], equity_growth_rates: List[float]) -> TrendDirection:
+        """Assess leverage trend by comparing debt vs equity growth."""
+        if not debt_growth_rates or not equity_growth_rates:
+            return TrendDirection.INSUFFICIENT_DATA
+        
+        avg_debt_growth = self._calculate_average(debt_growth_rates)
+        avg_equity_growth = self._calculate_average(equity_growth_rates)
+        
+        if avg_debt_growth is None or avg_equity_growth is None:
+            return TrendDirection.INSUFFICIENT_DATA
+        
+        leverage_change = avg_debt_growth - avg_equity_growth
+        
+        if leverage_change > 10:  # Debt growing much faster than equity
+            return TrendDirection.DECLINING  # Worsening leverage
+        elif leverage_change > 3:
+            return TrendDirection.VOLATILE
+        elif leverage_change > -3:
+            return TrendDirection.STABLE
+        else:  # Equity growing faster than debt
+            return TrendDirection.MODERATE_GROWTH  # Improving leverage
+    
     # Health assessment methods
     def _assess_liquidity_health(self, metrics: Optional[BalanceSheetMetrics]) -> Tuple[Optional[float], FinancialHealthRating]:
         """Assess liquidity health and return score and rating."""
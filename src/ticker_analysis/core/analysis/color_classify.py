@@ -0,0 +1,68 @@
+"""
+Color Classification Module
+
+This module provides batch classifiers that map arrays of financial ratios
+to color codes for console display. The kernels are compiled with Numba when
+it is installed and run as plain Python loops otherwise.
+"""
+
+import numpy as np
+
+from ._jit import tjit
+
+
+# Color codes returned by the classifiers
+COLOR_NONE = 0
+COLOR_GREEN = 1
+COLOR_YELLOW = 2
+COLOR_RED = 3
+
+
+@tjit('int8[:](float64[:])', cache=True)
+def classify_leverage(ratios: np.ndarray) -> np.ndarray:
+    """
+    Classify debt-to-equity ratios into color codes.
+
+    Args:
+        ratios: Array of debt-to-equity ratios (NaN for missing values)
+
+    Returns:
+        int8 array of color codes (COLOR_NONE for missing values)
+    """
+    out = np.empty(ratios.size, np.int8)
+    for i in range(ratios.size):
+        r = ratios[i]
+        if r != r:  # NaN
+            out[i] = 0
+        elif r < 0.3:
+            out[i] = 1
+        elif r < 0.6:
+            out[i] = 2
+        elif r > 1.5:
+            out[i] = 3
+        else:
+            out[i] = 2
+    return out
+
+
+@tjit('int8[:](float64[:])', cache=True)
+def classify_performance(changes: np.ndarray) -> np.ndarray:
+    """
+    Classify percentage price changes into color codes.
+
+    Args:
+        changes: Array of percentage changes (NaN for missing values)
+
+    Returns:
+        int8 array of color codes (green for gains, red otherwise)
+    """
+    out = np.empty(changes.size, np.int8)
+    for i in range(changes.size):
+        v = changes[i]
+        if v != v:  # NaN
+            out[i] = 0
+        elif v > 0:
+            out[i] = 1
+        else:
+            out[i] = 3
+    return out
@@ -5,12 +5,22 @@ This module provides income statement analysis functionality for general company
 including quarterly metrics extraction, yearly trend analysis, and financial health assessment.
 """
 
+import sys
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from statistics import fmean
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+import numpy as np
 from ..data.fetchers.income_statement import IncomeStatementData
 from ..data.enums import DataFrequency
+from ._jit import tjit, prange
+
+
+# Slot-based dataclasses (no per-instance __dict__) where the interpreter supports them
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class FinancialHealthRating(Enum):
@@ -32,7 +42,7 @@ class TrendDirection(Enum):
     INSUFFICIENT_DATA = "Insufficient Data"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class IncomeStatementMetrics:
     """
     Dataclass representing key metrics extracted from the latest quarterly income statement.
@@ -60,7 +70,7 @@ class IncomeStatementMetrics:
     gross_margin: Optional[float] = None       # Gross Profit / Revenue
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class YearlyFinancialData:
     """
     Dataclass representing financial data for a specific year.
@@ -74,7 +84,7 @@ class YearlyFinancialData:
     ebitda: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TrendAnalysis:
     """
     Dataclass representing comprehensive trend analysis over 3 years.
@@ -119,7 +129,7 @@ class TrendAnalysis:
     overall_consistency_score: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FinancialHealthAssessment:
     """
     Dataclass representing comprehensive financial health assessment.
@@ -162,6 +172,154 @@ class FinancialHealthAssessment:
             self.concerns = []
 
 
+@lru_cache(maxsize=256)
+def _year_of(date_str: Optional[str]) -> int:
+    """Parse the year from a YYYY-MM-DD period end date (0 if missing)."""
+    return int(date_str[:4]) if date_str else 0
+
+
+# Structured record for bulk yearly income statement data (NaN for missing values)
+YEARLY_DTYPE = np.dtype([
+    ('year', 'i4'),
+    ('revenue', 'f8'),
+    ('net_income', 'f8'),
+    ('operating_income', 'f8'),
+    ('eps', 'f8'),
+    ('gross_profit', 'f8'),
+    ('ebitda', 'f8'),
+])
+_YEARLY_VALUE_FIELDS = YEARLY_DTYPE.names[1:]
+_YEARLY_METRIC_FIELDS = ('revenue', 'net_income', 'operating_income', 'eps')
+
+
+# Fixed summaries for assessments without enough data
+_NO_DATA_SUMMARY = "Insufficient data available for financial health assessment."
+_INSUFFICIENT_SUMMARY = "Insufficient data available for comprehensive financial health assessment."
+
+# Average growth thresholds (strict '>') and the trend each bucket maps to
+_TREND_THRESHOLDS = (-3.0, 3.0, 10.0)
+_TREND_BUCKETS = (
+    TrendDirection.DECLINING,
+    TrendDirection.STABLE,
+    TrendDirection.MODERATE_GROWTH,
+    TrendDirection.STRONG_GROWTH,
+)
+
+# Score thresholds (inclusive '>=') and the rating each bucket maps to
+_RATING_THRESHOLDS = (5.0, 7.0, 8.5)
+_RATING_BUCKETS = (
+    FinancialHealthRating.POOR,
+    FinancialHealthRating.FAIR,
+    FinancialHealthRating.GOOD,
+    FinancialHealthRating.EXCELLENT,
+)
+
+# Trend directions indexed by the codes produced by _analysis_kernel
+_TREND_CODES = (
+    TrendDirection.INSUFFICIENT_DATA,
+    TrendDirection.VOLATILE,
+    TrendDirection.DECLINING,
+    TrendDirection.STABLE,
+    TrendDirection.MODERATE_GROWTH,
+    TrendDirection.STRONG_GROWTH,
+)
+
+
+# Explicit signature so Numba compiles (or loads from cache) at import time
+# rather than on the first analyzed ticker
+@tjit(
+    'void(float64[:, :, :], boolean[:, :, :], float64[:, :, :], int64[:, :], float64[:, :], float64[:, :], float64[:, :], int8[:, :])',
+    parallel=True,
+    cache=True
+)
+def _analysis_kernel(values, present, out_growth, out_counts, out_avgs, out_vols, out_cons, out_trends):
+    """
+    Compute yearly trend statistics for many tickers in one pass.
+    
+    Mirrors the per-ticker helpers of CompanyIncomeStatementAnalyzer, down to
+    the min()/max() comparisons, so batch and single-ticker results match,
+    NaN values included.
+    
+    Args:
+        values: (4, N, years) array of revenue, net income, operating income and
+            EPS, oldest year first
+        present: (4, N, years) mask of the values that are not None
+        out_growth: (4, N, years - 1) output of growth rates, packed to the left
+        out_counts: (4, N) output of the number of growth rates
+        out_avgs: (4, N) output of average growth rates (valid where count > 0)
+        out_vols: (4, N) output of growth rate volatility (valid where count >= 2)
+        out_cons: (N, 3) output of revenue, earnings and overall consistency
+            (NaN if missing)
+        out_trends: (4, N) output of _TREND_CODES indices
+    """
+    n_metrics, n_tickers, n_years = values.shape
+    for t in prange(n_tickers):
+        for m in range(n_metrics):
+            count = 0
+            total = 0.0
+            for j in range(1, n_years):
+                prev = values[m, t, j - 1]
+                curr = values[m, t, j]
+                # NaN values are present and propagate, like in the list helpers
+                if present[m, t, j - 1] and present[m, t, j] and prev != 0:
+                    growth = ((curr - prev) / abs(prev)) * 100
+                    out_growth[m, t, count] = growth
+                    count += 1
+                    total += growth
+            
+            avg = np.nan
+            vol = np.nan
+            trend = 0
+            if count > 0:
+                avg = total / count
+                if count >= 2:
+                    variance = 0.0
+                    for j in range(count):
+                        variance += (out_growth[m, t, j] - avg) ** 2
+                    vol = (variance / count) ** 0.5
+                if vol > 25:
+                    trend = 1
+                elif avg > 10:
+                    trend = 5
+                elif avg > 3:
+                    trend = 4
+                elif avg > -3:
+                    trend = 3
+                else:
+                    trend = 2
+            out_counts[m, t] = count
+            out_avgs[m, t] = avg
+            out_vols[m, t] = vol
+            out_trends[m, t] = trend
+        
+        # Consistency scores for revenue (metric 0) and EPS (metric 3). Clamps
+        # spell out Python's min()/max() so a NaN volatility scores 10.0
+        total = 0.0
+        count = 0
+        for k in range(2):
+            m = 0 if k == 0 else 3
+            score = np.nan
+            if out_counts[m, t] >= 2:
+                penalty = out_vols[m, t] / 5
+                if 8 < penalty:
+                    penalty = 8.0
+                score = 10.0 - penalty
+                avg = out_avgs[m, t]
+                if avg > 0:
+                    bonus = avg / 10
+                    if 2 < bonus:
+                        bonus = 2.0
+                    score += bonus
+                if not score < 10.0:
+                    score = 10.0
+                if not score > 0.0:
+                    score = 0.0
+                total += score
+                count += 1
+            out_cons[t, k] = score
+        out_cons[t, 2] = total / count if count > 0 else np.nan
+
+
 class CompanyIncomeStatementAnalyzer:
     """
     Analyzer class for processing income statement data and generating comprehensive company analysis.
@@ -172,7 +330,7 @@ class CompanyIncomeStatementAnalyzer:
     
     def __init__(self):
         """Initialize the income statement analyzer."""
-        pass
+        self._today_cache: Optional[str] = None
     
     def analyze_latest_quarter(self, quarterly_data: List[IncomeStatementData]) -> Optional[IncomeStatementMetrics]:
         """
@@ -196,12 +354,14 @@ class CompanyIncomeStatementAnalyzer:
         gross_margin = None
         
         if latest_quarter.total_revenue and latest_quarter.total_revenue != 0:
+            # One divide, then a multiply per margin
+            inv_revenue = 100.0 / latest_quarter.total_revenue
             if latest_quarter.net_income is not None:
-                net_profit_margin = (latest_quarter.net_income / latest_quarter.total_revenue) * 100
+                net_profit_margin = latest_quarter.net_income * inv_revenue
             if latest_quarter.operating_income is not None:
-                operating_margin = (latest_quarter.operating_income / latest_quarter.total_revenue) * 100
+                operating_margin = latest_quarter.operating_income * inv_revenue
             if latest_quarter.gross_profit is not None:
-                gross_margin = (latest_quarter.gross_profit / latest_quarter.total_revenue) * 100
+                gross_margin = latest_quarter.gross_profit * inv_revenue
         
         return IncomeStatementMetrics(
             ticker=latest_quarter.ticker,
@@ -217,12 +377,17 @@ class CompanyIncomeStatementAnalyzer:
             gross_margin=gross_margin
         )
     
-    def analyze_yearly_trends(self, yearly_data: List[IncomeStatementData]) -> Optional[TrendAnalysis]:
+    def analyze_yearly_trends(
+        self, 
+        yearly_data: List[IncomeStatementData], 
+        as_of: Optional[str] = None
+    ) -> Optional[TrendAnalysis]:
         """
         Analyze yearly income statement trends over the last 3 years.
         
         Args:
             yearly_data: List of IncomeStatementData objects (yearly frequency)
+            as_of: Analysis date (YYYY-MM-DD); defaults to today
             
         Returns:
             TrendAnalysis object with trend analysis results, or None if insufficient data
@@ -234,27 +399,72 @@ class CompanyIncomeStatementAnalyzer:
         recent_years = yearly_data[:3]  # Most recent first
         recent_years.reverse()  # Oldest first for trend calculation
         
-        ticker = recent_years[0].ticker
-        
-        # Convert to YearlyFinancialData objects
-        yearly_financial_data = []
-        for year_data in recent_years:
-            year = int(year_data.period_end_date[:4]) if year_data.period_end_date else 0
-            yearly_financial_data.append(YearlyFinancialData(
-                year=year,
-                revenue=year_data.total_revenue,
-                net_income=year_data.net_income,
-                operating_income=year_data.operating_income,
-                eps=year_data.diluted_eps,
-                gross_profit=year_data.gross_profit,
-                ebitda=year_data.ebitda
-            ))
+        yearly_financial_data = self._build_yearly_financial_data(recent_years)
         
         # Calculate growth rates
-        revenue_growth_rates = self._calculate_growth_rates([yd.revenue for yd in yearly_financial_data])
-        net_income_growth_rates = self._calculate_growth_rates([yd.net_income for yd in yearly_financial_data])
-        operating_income_growth_rates = self._calculate_growth_rates([yd.operating_income for yd in yearly_financial_data])
-        eps_growth_rates = self._calculate_growth_rates([yd.eps for yd in yearly_financial_data])
+        growth_rate_lists = [
+            self._calculate_growth_rates([yd.revenue for yd in yearly_financial_data]),
+            self._calculate_growth_rates([yd.net_income for yd in yearly_financial_data]),
+            self._calculate_growth_rates([yd.operating_income for yd in yearly_financial_data]),
+            self._calculate_growth_rates([yd.eps for yd in yearly_financial_data])
+        ]
+        
+        return self._analyze_trend_rates(recent_years[0].ticker, yearly_financial_data, growth_rate_lists, as_of)
+    
+    def analyze_yearly_trends_np(
+        self, 
+        ticker: str, 
+        buf: np.ndarray, 
+        as_of: Optional[str] = None
+    ) -> Optional[TrendAnalysis]:
+        """
+        Analyze yearly income statement trends from a YEARLY_DTYPE structured array.
+        
+        Equivalent to analyze_yearly_trends, but reads metric columns straight
+        from the buffer instead of a list of IncomeStatementData objects.
+        
+        Args:
+            ticker: Stock ticker symbol
+            buf: YEARLY_DTYPE array, one row per year, most recent first
+                (NaN for missing values, year 0 if unknown)
+            as_of: Analysis date (YYYY-MM-DD); defaults to today
+            
+        Returns:
+            TrendAnalysis object with trend analysis results, or None if insufficient data
+        """
+        if buf is None or len(buf) < 2:
+            return None
+        
+        # Last 3 years, oldest first for trend calculation
+        recent = buf[:3][::-1]
+        
+        yearly_financial_data = [
+            YearlyFinancialData(
+                year=row[0],
+                **{name: (None if value != value else value) for name, value in zip(_YEARLY_VALUE_FIELDS, row[1:])}
+            )
+            for row in recent.tolist()
+        ]
+        columns = np.column_stack([recent[name] for name in _YEARLY_METRIC_FIELDS]).astype(np.float64)
+        
+        return self._analyze_trend_rates(
+            ticker, yearly_financial_data, self._calculate_growth_rate_columns(columns), as_of
+        )
+    
+    def _analyze_trend_rates(
+        self, 
+        ticker: str, 
+        yearly_financial_data: List[YearlyFinancialData], 
+        growth_rate_lists: List[List[float]], 
+        as_of: Optional[str]
+    ) -> TrendAnalysis:
+        """Build a TrendAnalysis from yearly data and the revenue, net income, operating income and EPS growth rates."""
+        (
+            revenue_growth_rates,
+            net_income_growth_rates,
+            operating_income_growth_rates,
+            eps_growth_rates
+        ) = growth_rate_lists
         
         # Calculate average growth rates
         avg_revenue_growth = self._calculate_average(revenue_growth_rates)
@@ -262,27 +472,32 @@ class CompanyIncomeStatementAnalyzer:
         avg_operating_income_growth = self._calculate_average(operating_income_growth_rates)
         avg_eps_growth = self._calculate_average(eps_growth_rates)
         
-        # Assess trend directions
-        revenue_trend = self._assess_trend_direction(revenue_growth_rates, avg_revenue_growth)
-        net_income_trend = self._assess_trend_direction(net_income_growth_rates, avg_net_income_growth)
-        operating_income_trend = self._assess_trend_direction(operating_income_growth_rates, avg_operating_income_growth)
-        earnings_trend = self._assess_trend_direction(eps_growth_rates, avg_eps_growth)
+        # Calculate volatility (standard deviation), once per metric
+        revenue_volatility = self._calculate_volatility(revenue_growth_rates, avg_revenue_growth)
+        net_income_volatility = self._calculate_volatility(net_income_growth_rates, avg_net_income_growth)
+        operating_income_volatility = self._calculate_volatility(operating_income_growth_rates, avg_operating_income_growth)
+        eps_volatility = self._calculate_volatility(eps_growth_rates, avg_eps_growth)
         
-        # Calculate volatility (standard deviation)
-        revenue_volatility = self._calculate_volatility(revenue_growth_rates)
-        net_income_volatility = self._calculate_volatility(net_income_growth_rates)
-        operating_income_volatility = self._calculate_volatility(operating_income_growth_rates)
+        # Assess trend directions
+        revenue_trend = self._assess_trend_direction(revenue_growth_rates, avg_revenue_growth, revenue_volatility)
+        net_income_trend = self._assess_trend_direction(net_income_growth_rates, avg_net_income_growth, net_income_volatility)
+        operating_income_trend = self._assess_trend_direction(operating_income_growth_rates, avg_operating_income_growth, operating_income_volatility)
+        earnings_trend = self._assess_trend_direction(eps_growth_rates, avg_eps_growth, eps_volatility)
         
         # Calculate consistency scores
-        revenue_consistency_score = self._calculate_consistency_score(revenue_growth_rates, revenue_volatility)
-        earnings_consistency_score = self._calculate_consistency_score(eps_growth_rates, self._calculate_volatility(eps_growth_rates))
+        revenue_consistency_score = self._calculate_consistency_score(
+            revenue_growth_rates, revenue_volatility, avg_revenue_growth
+        )
+        earnings_consistency_score = self._calculate_consistency_score(
+            eps_growth_rates, eps_volatility, avg_eps_growth
+        )
         overall_consistency_score = self._calculate_overall_consistency(
             revenue_consistency_score, earnings_consistency_score
         )
         
         return TrendAnalysis(
             ticker=ticker,
-            analysis_date=datetime.now().strftime("%Y-%m-%d"),
+            analysis_date=as_of or self._today(),
             years_analyzed=len(yearly_financial_data),
             yearly_data=yearly_financial_data,
             revenue_growth_rates=revenue_growth_rates,
@@ -305,10 +520,97 @@ class CompanyIncomeStatementAnalyzer:
             overall_consistency_score=overall_consistency_score
         )
     
+    def analyze_yearly_trends_batch(
+        self, 
+        yearly_data_list: List[List[IncomeStatementData]], 
+        as_of: Optional[str] = None
+    ) -> List[Optional[TrendAnalysis]]:
+        """
+        Analyze yearly income statement trends for many tickers at once.
+        
+        Produces the same results as calling analyze_yearly_trends for each
+        ticker, but computes all growth statistics in a single compiled pass.
+        
+        Args:
+            yearly_data_list: One list of IncomeStatementData objects (yearly
+                frequency, most recent first) per ticker
+            as_of: Analysis date (YYYY-MM-DD); defaults to today
+            
+        Returns:
+            List of TrendAnalysis objects (None where data is insufficient),
+            in the same order as yearly_data_list
+        """
+        recent_list = [
+            list(reversed(yearly_data[:3])) if yearly_data and len(yearly_data) >= 2 else None
+            for yearly_data in yearly_data_list
+        ]
+        n_tickers = len(recent_list)
+        
+        # Metric-major SoA layout, oldest year first, right-aligned to 3 years
+        values = np.full((4, n_tickers, 3), np.nan)
+        present = np.zeros((4, n_tickers, 3), dtype=np.bool_)
+        for t, recent_years in enumerate(recent_list):
+            if recent_years is None:
+                continue
+            columns, columns_present = self._build_metric_columns(recent_years)
+            values[:, t, 3 - len(recent_years):] = columns.T
+            present[:, t, 3 - len(recent_years):] = columns_present.T
+        
+        out_growth = np.empty((4, n_tickers, 2))
+        out_counts = np.empty((4, n_tickers), dtype=np.int64)
+        out_avgs = np.empty((4, n_tickers))
+        out_vols = np.empty((4, n_tickers))
+        out_cons = np.empty((n_tickers, 3))
+        out_trends = np.empty((4, n_tickers), dtype=np.int8)
+        _analysis_kernel(values, present, out_growth, out_counts, out_avgs, out_vols, out_cons, out_trends)
+        
+        analysis_date = as_of or self._today()
+        growth = out_growth.tolist()
+        counts = out_counts.tolist()
+        # Averages and volatility may be NaN themselves, so None follows the counts
+        avgs = np.where(out_counts > 0, out_avgs, None).tolist()
+        vols = np.where(out_counts >= 2, out_vols, None).tolist()
+        cons = np.where(np.isnan(out_cons), None, out_cons).tolist()
+        trends = out_trends.tolist()
+        
+        results = []
+        for t, recent_years in enumerate(recent_list):
+            if recent_years is None:
+                results.append(None)
+                continue
+            growth_rates = [growth[m][t][:counts[m][t]] for m in range(4)]
+            results.append(TrendAnalysis(
+                ticker=recent_years[0].ticker,
+                analysis_date=analysis_date,
+                years_analyzed=len(recent_years),
+                yearly_data=self._build_yearly_financial_data(recent_years),
+                revenue_growth_rates=growth_rates[0],
+                net_income_growth_rates=growth_rates[1],
+                operating_income_growth_rates=growth_rates[2],
+                eps_growth_rates=growth_rates[3],
+                avg_revenue_growth=avgs[0][t],
+                avg_net_income_growth=avgs[1][t],
+                avg_operating_income_growth=avgs[2][t],
+                avg_eps_growth=avgs[3][t],
+                revenue_trend=_TREND_CODES[trends[0][t]],
+                net_income_trend=_TREND_CODES[trends[1][t]],
+                operating_income_trend=_TREND_CODES[trends[2][t]],
+                earnings_trend=_TREND_CODES[trends[3][t]],
+                revenue_volatility=vols[0][t],
+                net_income_volatility=vols[1][t],
+                operating_income_volatility=vols[2][t],
+                revenue_consistency_score=cons[t][0],
+                earnings_consistency_score=cons[t][1],
+                overall_consistency_score=cons[t][2]
+            ))
+        
+        return results
+    
     def assess_financial_health(
         self, 
         metrics: Optional[IncomeStatementMetrics], 
-        trends: Optional[TrendAnalysis]
+        trends: Optional[TrendAnalysis], 
+        as_of: Optional[str] = None
     ) -> FinancialHealthAssessment:
         """
         Assess overall financial health based on quarterly metrics and trend analysis.
@@ -316,6 +618,7 @@ class CompanyIncomeStatementAnalyzer:
         Args:
             metrics: IncomeStatementMetrics from latest quarter
             trends: TrendAnalysis from yearly data
+            as_of: Assessment date (YYYY-MM-DD); defaults to today
             
         Returns:
             FinancialHealthAssessment with comprehensive health evaluation
@@ -324,11 +627,11 @@ class CompanyIncomeStatementAnalyzer:
         
         assessment = FinancialHealthAssessment(
             ticker=ticker,
-            assessment_date=datetime.now().strftime("%Y-%m-%d")
+            assessment_date=as_of or self._today()
         )
         
         if not metrics and not trends:
-            assessment.summary = "Insufficient data available for financial health assessment."
+            assessment.summary = _NO_DATA_SUMMARY
             return assessment
         
         # Assess revenue health
@@ -367,8 +670,155 @@ class CompanyIncomeStatementAnalyzer:
         
         return assessment
     
+    def assess_financial_health_batch(
+        self, 
+        metrics_list: List[Optional[IncomeStatementMetrics]], 
+        trends_list: List[Optional[TrendAnalysis]], 
+        as_of: Optional[str] = None
+    ) -> List[FinancialHealthAssessment]:
+        """
+        Assess financial health for many tickers at once.
+        
+        Produces the same results as calling assess_financial_health for each
+        (metrics, trends) pair, but clamps, averages and rates all component
+        scores as one (N, 4) array.
+        
+        Args:
+            metrics_list: IncomeStatementMetrics per ticker (None if unavailable)
+            trends_list: TrendAnalysis per ticker, aligned with metrics_list
+            as_of: Assessment date (YYYY-MM-DD); defaults to today
+            
+        Returns:
+            List of FinancialHealthAssessment objects, in input order
+        """
+        assessment_date = as_of or self._today()
+        pairs = list(zip(metrics_list, trends_list))
+        
+        # Raw revenue, profitability, growth and consistency scores (NaN if missing)
+        scores = np.full((len(pairs), 4), np.nan)
+        for i, (metrics, trends) in enumerate(pairs):
+            if not metrics and not trends:
+                continue
+            for j, score in enumerate((
+                self._revenue_raw_score(metrics, trends),
+                self._profitability_raw_score(metrics, trends),
+                self._growth_raw_score(trends),
+                self._consistency_raw_score(trends)
+            )):
+                if score is not None:
+                    scores[i, j] = score
+        
+        np.clip(scores, 0.0, 10.0, out=scores)
+        present = ~np.isnan(scores)
+        counts = present.sum(axis=1)
+        totals = np.where(present, scores, 0.0).sum(axis=1)
+        overall = np.divide(totals, counts, out=np.full(len(pairs), np.nan), where=counts > 0)
+        component_ratings = np.searchsorted(_RATING_THRESHOLDS, scores, side='right').tolist()
+        overall_ratings = np.searchsorted(_RATING_THRESHOLDS, overall, side='right').tolist()
+        scores_list = np.where(present, scores, None).tolist()
+        present_list = present.tolist()
+        overall_list = overall.tolist()
+        
+        assessments = []
+        for i, (metrics, trends) in enumerate(pairs):
+            ticker = metrics.ticker if metrics else (trends.ticker if trends else "UNKNOWN")
+            assessment = FinancialHealthAssessment(ticker=ticker, assessment_date=assessment_date)
+            
+            if not metrics and not trends:
+                assessment.summary = _NO_DATA_SUMMARY
+                assessments.append(assessment)
+                continue
+            
+            ratings = [
+                _RATING_BUCKETS[component_ratings[i][j]] if present_list[i][j]
+                else FinancialHealthRating.INSUFFICIENT_DATA
+                for j in range(4)
+            ]
+            (
+                assessment.revenue_score,
+                assessment.profitability_score,
+                assessment.growth_score,
+                assessment.consistency_score
+            ) = scores_list[i]
+            (
+                assessment.revenue_health,
+                assessment.profitability_health,
+                assessment.growth_health,
+                assessment.consistency_health
+            ) = ratings
+            
+            if counts[i]:
+                assessment.overall_health_score = overall_list[i]
+                assessment.overall_health_rating = _RATING_BUCKETS[overall_ratings[i]]
+            
+            assessment.strengths, assessment.concerns = self._generate_strengths_and_concerns(
+                metrics, trends, assessment
+            )
+            assessment.summary = self._generate_health_summary(assessment)
+            assessments.append(assessment)
+        
+        return assessments
+    
+    def _today(self) -> str:
+        """Return today's date (YYYY-MM-DD), formatted once per analyzer."""
+        if self._today_cache is None:
+            self._today_cache = datetime.now().strftime("%Y-%m-%d")
+        return self._today_cache
+    
+    def _build_yearly_financial_data(self, recent_years: List[IncomeStatementData]) -> List[YearlyFinancialData]:
+        """Convert income statements (oldest first) to YearlyFinancialData objects."""
+        yearly_financial_data = []
+        for year_data in recent_years:
+            yearly_financial_data.append(YearlyFinancialData(
+                year=_year_of(year_data.period_end_date),
+                revenue=year_data.total_revenue,
+                net_income=year_data.net_income,
+                operating_income=year_data.operating_income,
+                eps=year_data.diluted_eps,
+                gross_profit=year_data.gross_profit,
+                ebitda=year_data.ebitda
+            ))
+        return yearly_financial_data
+    
+    def _build_metric_columns(self, recent_years: List[IncomeStatementData]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pack revenue, net income, operating income and EPS into (years, 4) arrays for the batch kernel.
+        
+        Rows follow recent_years (oldest first). Returns the values (NaN where
+        missing) and a mask of the values that are not None, so NaN values
+        can still propagate like in the list helpers.
+        """
+        columns = np.full((len(recent_years), 4), np.nan)
+        present = np.zeros((len(recent_years), 4), dtype=np.bool_)
+        for i, year_data in enumerate(recent_years):
+            for j, value in enumerate((
+                year_data.total_revenue,
+                year_data.net_income,
+                year_data.operating_income,
+                year_data.diluted_eps
+            )):
+                if value is not None:
+                    columns[i, j] = value
+                    present[i, j] = True
+        return columns, present
+    
+    def _calculate_growth_rate_columns(self, columns: np.ndarray) -> List[List[float]]:
+        """Calculate year-over-year growth rates for each column of a (years, metrics) array."""
+        prev = columns[:-1]
+        curr = columns[1:]
+        
+        # Skip pairs with a missing value or a zero base year
+        mask = ~np.isnan(prev) & ~np.isnan(curr) & (prev != 0)
+        growth_rates = (curr - prev) / np.abs(np.where(mask, prev, 1.0)) * 100
+        
+        return [growth_rates[mask[:, j], j].tolist() for j in range(columns.shape[1])]
+    
     def _calculate_growth_rates(self, values: List[Optional[float]]) -> List[float]:
-        """Calculate year-over-year growth rates from a list of values."""
+        """
+        Calculate year-over-year growth rates from a list of values.
+        
+        None values are skipped; NaN values are kept and yield NaN growth rates.
+        """
         growth_rates = []
         
         for i in range(1, len(values)):
@@ -382,40 +832,45 @@ class CompanyIncomeStatementAnalyzer:
         """Calculate average of a list of values."""
         if not values:
             return None
-        return sum(values) / len(values)
+        return fmean(values)
     
-    def _calculate_volatility(self, values: List[float]) -> Optional[float]:
-        """Calculate standard deviation (volatility) of a list of values."""
+    def _calculate_volatility(self, values: List[float], mean: Optional[float] = None) -> Optional[float]:
+        """Calculate standard deviation (volatility) of a list of values, reusing a known mean."""
         if len(values) < 2:
             return None
         
-        mean = sum(values) / len(values)
+        if mean is None:
+            mean = fmean(values)
         variance = sum((x - mean) ** 2 for x in values) / len(values)
         return variance ** 0.5
     
-    def _assess_trend_direction(self, growth_rates: List[float], avg_growth: Optional[float]) -> TrendDirection:
-        """Assess the overall trend direction based on growth rates."""
+    def _assess_trend_direction(
+        self, 
+        growth_rates: List[float], 
+        avg_growth: Optional[float], 
+        volatility: Optional[float] = None
+    ) -> TrendDirection:
+        """Assess the overall trend direction based on growth rates and their volatility."""
         if not growth_rates or avg_growth is None:
             return TrendDirection.INSUFFICIENT_DATA
         
-        volatility = self._calculate_volatility(growth_rates)
+        if volatility is None:
+            volatility = self._calculate_volatility(growth_rates, avg_growth)
         
         # High volatility threshold
         if volatility and volatility > 25:  # More than 25% standard deviation
             return TrendDirection.VOLATILE
         
-        # Trend assessment based on average growth
-        if avg_growth > 10:  # More than 10% average growth
-            return TrendDirection.STRONG_GROWTH
-        elif avg_growth > 3:  # 3-10% average growth
-            return TrendDirection.MODERATE_GROWTH
-        elif avg_growth > -3:  # Between -3% and 3%
-            return TrendDirection.STABLE
-        else:  # Less than -3% average growth
-            return TrendDirection.DECLINING
-    
-    def _calculate_consistency_score(self, growth_rates: List[float], volatility: Optional[float]) -> Optional[float]:
-        """Calculate consistency score (0-10) based on growth rates and volatility."""
+        # Trend assessment based on average growth (-3%, 3% and 10% boundaries)
+        return _TREND_BUCKETS[bisect_left(_TREND_THRESHOLDS, avg_growth)]
+    
+    def _calculate_consistency_score(
+        self, 
+        growth_rates: List[float], 
+        volatility: Optional[float], 
+        avg_growth: Optional[float] = None
+    ) -> Optional[float]:
+        """Calculate consistency score (0-10) based on growth rates, volatility and their known average."""
         if not growth_rates or volatility is None:
             return None
         
@@ -427,7 +882,8 @@ class CompanyIncomeStatementAnalyzer:
         score -= volatility_penalty
         
         # Bonus for positive average growth
-        avg_growth = sum(growth_rates) / len(growth_rates)
+        if avg_growth is None:
+            avg_growth = fmean(growth_rates)
         if avg_growth > 0:
             growth_bonus = min(avg_growth / 10, 2)  # Max bonus of 2 points
             score += growth_bonus
@@ -439,12 +895,16 @@ class CompanyIncomeStatementAnalyzer:
         scores = [s for s in [revenue_score, earnings_score] if s is not None]
         if not scores:
             return None
-        return sum(scores) / len(scores)
+        return fmean(scores)
     
     def _assess_revenue_health(self, metrics: Optional[IncomeStatementMetrics], trends: Optional[TrendAnalysis]) -> Tuple[Optional[float], FinancialHealthRating]:
         """Assess revenue health and return score and rating."""
+        return self._clamp_and_rate(self._revenue_raw_score(metrics, trends))
+    
+    def _revenue_raw_score(self, metrics: Optional[IncomeStatementMetrics], trends: Optional[TrendAnalysis]) -> Optional[float]:
+        """Calculate the unclamped revenue health score, or None if insufficient data."""
         if not trends or not trends.avg_revenue_growth:
-            return None, FinancialHealthRating.INSUFFICIENT_DATA
+            return None
         
         score = 5.0  # Base score
         
@@ -461,11 +921,14 @@ class CompanyIncomeStatementAnalyzer:
             consistency_factor = (trends.revenue_consistency_score - 5) / 2
             score += consistency_factor
         
-        score = max(0.0, min(10.0, score))
-        return score, self._score_to_rating(score)
+        return score
     
     def _assess_profitability_health(self, metrics: Optional[IncomeStatementMetrics], trends: Optional[TrendAnalysis]) -> Tuple[Optional[float], FinancialHealthRating]:
         """Assess profitability health and return score and rating."""
+        return self._clamp_and_rate(self._profitability_raw_score(metrics, trends))
+    
+    def _profitability_raw_score(self, metrics: Optional[IncomeStatementMetrics], trends: Optional[TrendAnalysis]) -> float:
+        """Calculate the unclamped profitability health score."""
         score = 5.0  # Base score
         
         # Latest quarter profitability
@@ -486,13 +949,16 @@ class CompanyIncomeStatementAnalyzer:
             elif trends.avg_net_income_growth < -10:
                 score -= 2
         
-        score = max(0.0, min(10.0, score))
-        return score, self._score_to_rating(score)
+        return score
     
     def _assess_growth_health(self, trends: Optional[TrendAnalysis]) -> Tuple[Optional[float], FinancialHealthRating]:
         """Assess growth health and return score and rating."""
+        return self._clamp_and_rate(self._growth_raw_score(trends))
+    
+    def _growth_raw_score(self, trends: Optional[TrendAnalysis]) -> Optional[float]:
+        """Calculate the unclamped growth health score, or None if insufficient data."""
         if not trends:
-            return None, FinancialHealthRating.INSUFFICIENT_DATA
+            return None
         
         score = 5.0  # Base score
         
@@ -505,7 +971,7 @@ class CompanyIncomeStatementAnalyzer:
         
         valid_rates = [rate for rate in growth_rates if rate is not None]
         if valid_rates:
-            avg_overall_growth = sum(valid_rates) / len(valid_rates)
+            avg_overall_growth = fmean(valid_rates)
             
             if avg_overall_growth > 8:
                 score += 3
@@ -514,26 +980,33 @@ class CompanyIncomeStatementAnalyzer:
             elif avg_overall_growth < -5:
                 score -= 3
         
-        score = max(0.0, min(10.0, score))
-        return score, self._score_to_rating(score)
+        return score
     
     def _assess_consistency_health(self, trends: Optional[TrendAnalysis]) -> Tuple[Optional[float], FinancialHealthRating]:
         """Assess consistency health and return score and rating."""
+        score = self._consistency_raw_score(trends)
+        if score is None:
+            return None, FinancialHealthRating.INSUFFICIENT_DATA
+        
+        return score, self._score_to_rating(score)
+    
+    def _consistency_raw_score(self, trends: Optional[TrendAnalysis]) -> Optional[float]:
+        """Return the overall consistency score (already 0-10), or None if insufficient data."""
         if not trends or not trends.overall_consistency_score:
+            return None
+        return trends.overall_consistency_score
+    
+    def _clamp_and_rate(self, score: Optional[float]) -> Tuple[Optional[float], FinancialHealthRating]:
+        """Clamp a raw component score to 0-10 and convert it to a rating."""
+        if score is None:
             return None, FinancialHealthRating.INSUFFICIENT_DATA
         
-        return trends.overall_consistency_score, self._score_to_rating(trends.overall_consistency_score)
+        score = max(0.0, min(10.0, score))
+        return score, self._score_to_rating(score)
     
     def _score_to_rating(self, score: float) -> FinancialHealthRating:
         """Convert numerical score to health rating."""
-        if score >= 8.5:
-            return FinancialHealthRating.EXCELLENT
-        elif score >= 7.0:
-            return FinancialHealthRating.GOOD
-        elif score >= 5.0:
-            return FinancialHealthRating.FAIR
-        else:
-            return FinancialHealthRating.POOR
+        return _RATING_BUCKETS[bisect_right(_RATING_THRESHOLDS, score)]
     
     def _generate_strengths_and_concerns(
         self, 
@@ -546,55 +1019,58 @@ class CompanyIncomeStatementAnalyzer:
         concerns = []
         
         # Revenue analysis
-        if trends and trends.avg_revenue_growth:
-            if trends.avg_revenue_growth > 5:
-                strengths.append(f"Strong revenue growth averaging {trends.avg_revenue_growth:.1f}% annually")
-            elif trends.avg_revenue_growth < -3:
-                concerns.append(f"Declining revenue with {trends.avg_revenue_growth:.1f}% average annual decline")
+        growth = trends.avg_revenue_growth if trends else None
+        if growth:
+            if growth > 5:
+                strengths.append(f"Strong revenue growth averaging {growth:.1f}% annually")
+            elif growth < -3:
+                concerns.append(f"Declining revenue with {growth:.1f}% average annual decline")
         
         # Profitability analysis
-        if metrics and metrics.net_profit_margin:
-            if metrics.net_profit_margin > 10:
-                strengths.append(f"Healthy profit margin of {metrics.net_profit_margin:.1f}%")
-            elif metrics.net_profit_margin < 0:
-                concerns.append(f"Negative profit margin of {metrics.net_profit_margin:.1f}%")
+        margin = metrics.net_profit_margin if metrics else None
+        if margin:
+            if margin > 10:
+                strengths.append(f"Healthy profit margin of {margin:.1f}%")
+            elif margin < 0:
+                concerns.append(f"Negative profit margin of {margin:.1f}%")
         
         # Consistency analysis
-        if trends and trends.overall_consistency_score:
-            if trends.overall_consistency_score > 7:
+        consistency = trends.overall_consistency_score if trends else None
+        if consistency:
+            if consistency > 7:
                 strengths.append("Consistent financial performance with low volatility")
-            elif trends.overall_consistency_score < 4:
+            elif consistency < 4:
                 concerns.append("High volatility in financial performance")
         
         # Growth trend analysis
         if trends:
-            declining_metrics = []
-            if trends.revenue_trend == TrendDirection.DECLINING:
-                declining_metrics.append("revenue")
-            if trends.net_income_trend == TrendDirection.DECLINING:
-                declining_metrics.append("net income")
-            if trends.operating_income_trend == TrendDirection.DECLINING:
-                declining_metrics.append("operating income")
-            
-            if declining_metrics:
-                concerns.append(f"Declining trend in {', '.join(declining_metrics)}")
+            declining = TrendDirection.DECLINING
+            metric_trends = (
+                (trends.revenue_trend, "revenue"),
+                (trends.net_income_trend, "net income"),
+                (trends.operating_income_trend, "operating income"),
+            )
+            if any(trend is declining for trend, _ in metric_trends):
+                concerns.append(
+                    f"Declining trend in {', '.join(name for trend, name in metric_trends if trend is declining)}"
+                )
         
         return strengths, concerns
     
     def _generate_health_summary(self, assessment: FinancialHealthAssessment) -> str:
         """Generate a comprehensive health summary."""
         if assessment.overall_health_rating == FinancialHealthRating.INSUFFICIENT_DATA:
-            return "Insufficient data available for comprehensive financial health assessment."
+            return _INSUFFICIENT_SUMMARY
         
         rating_text = assessment.overall_health_rating.value.lower()
         score_text = f"{assessment.overall_health_score:.1f}/10" if assessment.overall_health_score else "N/A"
         
-        summary = f"Overall financial health is {rating_text} with a score of {score_text}. "
+        parts = [f"Overall financial health is {rating_text} with a score of {score_text}. "]
         
         if assessment.strengths:
-            summary += f"Key strengths include {', '.join(assessment.strengths[:2])}. "
+            parts.append(f"Key strengths include {', '.join(assessment.strengths[:2])}. ")
         
         if assessment.concerns:
-            summary += f"Areas of concern include {', '.join(assessment.concerns[:2])}."
+            parts.append(f"Areas of concern include {', '.join(assessment.concerns[:2])}.")
         
-        return summary.strip()
\ No newline at end of file
+        return "".join(parts).strip()
\ No newline at end of file
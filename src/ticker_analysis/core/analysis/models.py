@@ -4,18 +4,20 @@ Company Data Models
 This module contains data models for general company financial analysis.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Optional
 from ..data.fetchers.company_info import CompanyInfoData
 from .dividend import DividendAnalysisData
-from .income_statement import IncomeStatementMetrics, TrendAnalysis, FinancialHealthAssessment
+from .income_statement import IncomeStatementMetrics, TrendAnalysis, FinancialHealthAssessment, _DATACLASS_OPTIONS
 from .balance_sheet import BalanceSheetMetrics, BalanceSheetTrendAnalysis, BalanceSheetHealthAssessment
 from .cash_flow import CashFlowMetrics, CashFlowTrendAnalysis, CashFlowHealthAssessment
 from .price import PriceAnalysisData
 from .technical import TechnicalIndicators
 
 
-@dataclass
+# Report aggregate: never compared, so skip the generated field-by-field __eq__
+@dataclass(eq=False, **_DATACLASS_OPTIONS)
 class CompanyAnalysisData:
     """
     Dataclass representing comprehensive analysis information for a ticker.
@@ -132,51 +134,10 @@ class CompanyAnalysisData:
         Returns:
             CompanyAnalysisData object with mapped values
         """
+        # Shared fields are the leading CompanyAnalysisData fields, so they are
+        # fetched in one attrgetter call and passed positionally
         return cls(
-            # Basic Information (minimal)
-            ticker=company_info.ticker,
-            exchange=company_info.exchange,
-            sector=company_info.sector,
-            
-            # Market Data
-            last_price=company_info.last_price,
-            market_cap=company_info.market_cap,
-            last_volume=company_info.last_volume,
-            avg_volume=company_info.avg_volume,
-            fifty_two_week_high=company_info.fifty_two_week_high,
-            fifty_two_week_low=company_info.fifty_two_week_low,
-            
-            # Valuation Metrics
-            pe_ratio=company_info.pe_ratio,
-            forward_pe=company_info.forward_pe,
-            pb_ratio=company_info.pb_ratio,
-            price_to_sales=company_info.price_to_sales,
-            enterprise_value=company_info.enterprise_value,
-            ev_to_revenue=company_info.ev_to_revenue,
-            ev_to_ebitda=company_info.ev_to_ebitda,
-            dividend_yield=company_info.dividend_yield,
-            beta=company_info.beta,
-            
-            # Financial Metrics
-            profit_margins=company_info.profit_margins,
-            operating_margins=company_info.operating_margins,
-            return_on_assets=company_info.return_on_assets,
-            return_on_equity=company_info.return_on_equity,
-            debt_to_equity=company_info.debt_to_equity,
-            current_ratio=company_info.current_ratio,
-            quick_ratio=company_info.quick_ratio,
-            revenue_growth=company_info.revenue_growth,
-            earnings_growth=company_info.earnings_growth,
-            
-            # External Analysis Sentiment
-            recommendation=company_info.recommendation,
-            target_price=company_info.target_price,
-            
-            # Company-specific metrics (None for now, will be populated later)
-            funds_from_operations=None,
-            adjusted_funds_from_operations=None,
-            net_asset_value=None,
-            occupancy_rate=None,
+            *_get_company_info_fields(company_info),
             
             # Dividend Analysis
             dividend_analysis=dividend_analysis,
@@ -201,4 +162,31 @@ class CompanyAnalysisData:
             
             # Technical Analysis
             technical_analysis=technical_analysis
-        )
\ No newline at end of file
+        )
+
+
+# Fields copied from CompanyInfoData, in CompanyAnalysisData declaration order.
+# Company-specific metrics (FFO, AFFO, NAV, occupancy) keep their None defaults.
+_COMPANY_INFO_FIELDS = (
+    # Basic Information (minimal)
+    'ticker', 'exchange', 'sector',
+    
+    # Market Data
+    'last_price', 'market_cap', 'last_volume', 'avg_volume',
+    'fifty_two_week_high', 'fifty_two_week_low',
+    
+    # Valuation Metrics
+    'pe_ratio', 'forward_pe', 'pb_ratio', 'price_to_sales', 'enterprise_value',
+    'ev_to_revenue', 'ev_to_ebitda', 'dividend_yield', 'beta',
+    
+    # Financial Metrics
+    'profit_margins', 'operating_margins', 'return_on_assets', 'return_on_equity',
+    'debt_to_equity', 'current_ratio', 'quick_ratio', 'revenue_growth', 'earnings_growth',
+    
+    # External Analysis Sentiment
+    'recommendation', 'target_price',
+)
+if _COMPANY_INFO_FIELDS != tuple(f.name for f in fields(CompanyAnalysisData))[:len(_COMPANY_INFO_FIELDS)]:
+    raise TypeError("_COMPANY_INFO_FIELDS must match the leading CompanyAnalysisData fields")
+
+_get_company_info_fields = attrgetter(*_COMPANY_INFO_FIELDS)
@@ -0,0 +1,106 @@
+"""
+Column-wise PDF Value Formatting
+
+This module formats whole columns of values for PDF tables, matching the
+scalar BasePDFFormatter methods element by element. It is kept out of
+base_formatter so only callers that format whole columns import NumPy.
+"""
+
+from typing import List, Tuple
+import numpy as np
+
+from .base_formatter import (
+    _COMPACT_THRESHOLDS,
+    _STATUS_PALETTE,
+    _fmt_whole,
+    _render_compact,
+    _render_percentage
+)
+
+
+# get_status_color palette as an object array for fancy indexing
+_STATUS_PALETTE_ARRAY = np.empty(len(_STATUS_PALETTE), dtype=object)
+_STATUS_PALETTE_ARRAY[:] = _STATUS_PALETTE
+
+
+def format_currency_array(values: np.ndarray, compact: bool = False, show_sign: bool = False) -> List[str]:
+    """
+    Format a column of currency values, matching BasePDFFormatter.format_currency per element.
+
+    Args:
+        values: Array of numeric values (NaN for missing values)
+        compact: Use compact notation for large numbers
+        show_sign: Whether to show + for positive values
+
+    Returns:
+        List of formatted currency strings ("N/A" for missing values)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if compact:
+        buckets = np.searchsorted(_COMPACT_THRESHOLDS, np.abs(values), side='right').tolist()
+    else:
+        buckets = [0] * values.size
+
+    return [
+        "N/A" if value != value else _render_compact(value, bucket, show_sign)
+        for value, bucket in zip(values.tolist(), buckets)
+    ]
+
+
+def format_percentage_array(values: np.ndarray, show_sign: bool = False,
+                            multiply_by_100: bool = True) -> List[str]:
+    """
+    Format a column of percentage values, matching BasePDFFormatter.format_percentage per element.
+
+    Args:
+        values: Array of numeric values (NaN for missing values)
+        show_sign: Include +/- sign
+        multiply_by_100: Whether to multiply by 100 (for decimal values like 0.15 -> 15%)
+
+    Returns:
+        List of formatted percentage strings ("N/A" for missing values)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if multiply_by_100:
+        values = values * 100
+
+    return [
+        "N/A" if value != value else _render_percentage(value, show_sign)
+        for value in values.tolist()
+    ]
+
+
+def format_volume_array(values: np.ndarray) -> List[str]:
+    """
+    Format a column of volume values, matching BasePDFFormatter.format_volume per element.
+
+    Args:
+        values: Array of numeric values (NaN for missing values)
+
+    Returns:
+        List of formatted volume strings ("N/A" for missing values)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    buckets = np.searchsorted(_COMPACT_THRESHOLDS, values, side='right').tolist()
+
+    return [
+        "N/A" if value != value else _render_compact(value, bucket, plain=_fmt_whole)
+        for value, bucket in zip(values.tolist(), buckets)
+    ]
+
+
+def get_status_color_array(values: np.ndarray, thresholds: Tuple[float, float]) -> np.ndarray:
+    """
+    Get colors for a column of values, matching BasePDFFormatter.get_status_color per element.
+
+    Args:
+        values: Array of numeric values
+        thresholds: Tuple of (good_threshold, bad_threshold)
+
+    Returns:
+        Object array of colors based on thresholds
+    """
+    values = np.asarray(values, dtype=np.float64)
+    good_threshold, bad_threshold = thresholds
+    indices = (values >= good_threshold) * 2 + ~(values <= bad_threshold)
+    return _STATUS_PALETTE_ARRAY[indices]
@@ -4,20 +4,90 @@ Balance Sheet Analysis PDF Formatter
 This module formats the balance sheet analysis section for PDF output.
 """
 
+from copy import copy
+from operator import attrgetter
 from typing import List
-from reportlab.platypus import Paragraph, Spacer, Table
+from reportlab.platypus import Paragraph, Table
 from reportlab.lib.units import inch
 
 from ..models import CompanyAnalysisData
-from ..balance_sheet import BalanceSheetHealthAssessment
+from ..balance_sheet import BalanceSheetHealthAssessment, FinancialHealthRating, TrendDirection
 from .base_formatter import BasePDFFormatter
 
 
+# (good, bad) thresholds passed to get_status_color
+_TH_CURRENT_RATIO = (1.5, 1.0)
+_TH_QUICK_RATIO = (1.0, 0.5)
+_TH_DTE = (0.6, 1.5)
+_TH_GROWTH = (0.03, -0.03)
+_TH_SCORE = (7.0, 4.0)
+_TH_OVERALL_SCORE = (7.0, 5.0)
+
+# Historical table columns read from each YearlyBalanceSheetData record
+_YEARLY_COLUMNS = attrgetter('year', 'total_assets', 'total_equity', 'total_debt', 'debt_to_equity')
+
+# Subsection titles whose header paragraphs are built once per formatter
+_SUBSECTION_TITLES = (
+    "Liquidity Ratios:",
+    "Leverage Ratios:",
+    "Financial Strength:",
+    "Average Annual Growth Rates:",
+    "Trend Assessment:",
+    "Stability Scores (0-10 scale):",
+    "Component Health Ratings:",
+    "Balance Sheet Strengths:",
+    "Balance Sheet Concerns:",
+    "Balance Sheet Summary:",
+)
+
+# Prebuilt "  <label>: <direction>" lines for the trend assessment, one
+# {TrendDirection: line} map per label in display order
+_TREND_LINES = tuple(
+    {trend: f"  {label}: {trend.value}" for trend in TrendDirection}
+    for label in ("Assets Trend", "Equity Trend", "Debt Trend", "Leverage Trend")
+)
+
+# Formatter for 0-10 scores, e.g. "7.5/10"
+_SCORE_FMT = "{:.1f}/10".format
+
+# Formatter for strength and concern list items
+_LIST_ITEM_FMT = "  • {}".format
+
+
 class BalanceSheetFormatter(BasePDFFormatter):
     """
     Formatter for the balance sheet analysis section in PDF reports.
     """
 
+    def __init__(self):
+        super().__init__()
+        # Colors used on every report, bound directly on the formatter
+        self._green = self.colors.SUCCESS_GREEN
+        self._yellow = self.colors.CAUTION_YELLOW
+        self._red = self.colors.WARNING_RED
+        self._text = self.colors.PRIMARY_TEXT
+
+        # Rating colors resolved once per formatter, keyed by enum member
+        self._rating_color_map = {
+            FinancialHealthRating.EXCELLENT: self._green,
+            FinancialHealthRating.GOOD: self._green,
+            FinancialHealthRating.FAIR: self._yellow,
+            FinancialHealthRating.POOR: self._red,
+            FinancialHealthRating.INSUFFICIENT_DATA: self._red,
+        }
+        self._subsection_headers = {
+            title: self.create_subsection_header(title) for title in _SUBSECTION_TITLES
+        }
+
+    def _get_health_rating_color(self, rating: FinancialHealthRating):
+        """Get the display color for a health rating enum member."""
+        return self._rating_color_map.get(rating, self._text)
+
+    def _subsection(self, title: str) -> List:
+        """Return a spacer followed by the header for a subsection."""
+        # Flowables carry layout state, so hand out copies of the pre-parsed header
+        return [self.create_spacing("tiny"), copy(self._subsection_headers[title])]
+
     def format_section(self, data: CompanyAnalysisData) -> List:
         """
         Format the balance sheet analysis section.
@@ -28,11 +98,11 @@ class BalanceSheetFormatter(BasePDFFormatter):
         Returns:
             List of PDF elements for this section
         """
-        elements = []
-
         # Section header
-        elements.append(self.create_section_header("🏦 BALANCE SHEET ANALYSIS"))
-        elements.append(Spacer(1, 0.1 * inch))
+        elements = [
+            self.create_section_header("🏦 BALANCE SHEET ANALYSIS"),
+            self.create_spacing("small"),
+        ]
 
         # Latest quarter metrics
         if data.balance_sheet_metrics:
@@ -51,140 +121,148 @@ class BalanceSheetFormatter(BasePDFFormatter):
     def _format_balance_sheet_metrics(self, metrics) -> List:
         """Format balance sheet metrics subsection."""
         elements = []
+        add = elements.append
+        cbp = self.create_bullet_point
+        subsection = self._subsection
 
-        elements.append(self.create_subheader("Latest Quarter Balance Sheet Metrics"))
-        elements.append(Spacer(1, 0.05 * inch))
+        add(self.create_subheader("Latest Quarter Balance Sheet Metrics"))
+        add(self.create_spacing("tiny"))
 
         # Quarter information
         if metrics.quarter_end_date:
-            elements.append(self.create_bullet_point(f"Quarter End Date: {metrics.quarter_end_date}"))
+            add(cbp(f"Quarter End Date: {metrics.quarter_end_date}"))
 
         # Liquidity ratios
-        elements.append(Spacer(1, 0.05 * inch))
-        elements.append(self.create_subsection_header("Liquidity Ratios:"))
+        elements.extend(subsection("Liquidity Ratios:"))
         if metrics.current_ratio is not None:
-            ratio_color = self.get_status_color(metrics.current_ratio, (1.5, 1.0))
-            elements.append(self.create_bullet_point(f"  Current Ratio: {self.format_ratio(metrics.current_ratio)}", ratio_color))
+            ratio_color = self.get_status_color(metrics.current_ratio, _TH_CURRENT_RATIO)
+            add(cbp(f"  Current Ratio: {self.format_ratio(metrics.current_ratio)}", ratio_color))
 
         if metrics.quick_ratio is not None:
-            ratio_color = self.get_status_color(metrics.quick_ratio, (1.0, 0.5))
-            elements.append(self.create_bullet_point(f"  Quick Ratio: {self.format_ratio(metrics.quick_ratio)}", ratio_color))
+            ratio_color = self.get_status_color(metrics.quick_ratio, _TH_QUICK_RATIO)
+            add(cbp(f"  Quick Ratio: {self.format_ratio(metrics.quick_ratio)}", ratio_color))
 
         if metrics.cash_ratio is not None:
-            elements.append(self.create_bullet_point(f"  Cash Ratio: {self.format_ratio(metrics.cash_ratio)}"))
+            add(cbp(f"  Cash Ratio: {self.format_ratio(metrics.cash_ratio)}"))
 
         # Leverage ratios
-        elements.append(Spacer(1, 0.05 * inch))
-        elements.append(self.create_subsection_header("Leverage Ratios:"))
+        elements.extend(subsection("Leverage Ratios:"))
         if metrics.debt_to_equity is not None:
-            ratio_color = self.get_status_color(metrics.debt_to_equity, (0.6, 1.5))
-            elements.append(self.create_bullet_point(f"  Debt-to-Equity: {self.format_ratio(metrics.debt_to_equity)}", ratio_color))
+            ratio_color = self.get_status_color(metrics.debt_to_equity, _TH_DTE)
+            add(cbp(f"  Debt-to-Equity: {self.format_ratio(metrics.debt_to_equity)}", ratio_color))
 
         if metrics.debt_to_assets is not None:
-            elements.append(self.create_bullet_point(f"  Debt-to-Assets: {self.format_ratio(metrics.debt_to_assets)}"))
+            add(cbp(f"  Debt-to-Assets: {self.format_ratio(metrics.debt_to_assets)}"))
 
         if metrics.equity_ratio is not None:
-            elements.append(self.create_bullet_point(f"  Equity Ratio: {self.format_ratio(metrics.equity_ratio)}"))
+            add(cbp(f"  Equity Ratio: {self.format_ratio(metrics.equity_ratio)}"))
 
         # Financial strength indicators
-        elements.append(Spacer(1, 0.05 * inch))
-        elements.append(self.create_subsection_header("Financial Strength:"))
-        elements.append(self.create_bullet_point(f"  Cash & Equivalents: {self.format_currency(metrics.cash_and_equivalents, compact=True)}"))
-        elements.append(self.create_bullet_point(f"  Total Debt: {self.format_currency(metrics.total_debt, compact=True)}"))
-        elements.append(self.create_bullet_point(f"  Total Equity: {self.format_currency(metrics.total_equity, compact=True)}"))
-        elements.append(self.create_bullet_point(f"  Working Capital: {self.format_currency(metrics.working_capital, compact=True)}"))
-
-        elements.append(Spacer(1, 0.1 * inch))
+        elements.extend(subsection("Financial Strength:"))
+        add(cbp(f"  Cash & Equivalents: {self.format_currency(metrics.cash_and_equivalents, compact=True)}"))
+        add(cbp(f"  Total Debt: {self.format_currency(metrics.total_debt, compact=True)}"))
+        add(cbp(f"  Total Equity: {self.format_currency(metrics.total_equity, compact=True)}"))
+        add(cbp(f"  Working Capital: {self.format_currency(metrics.working_capital, compact=True)}"))
+
+        add(self.create_spacing("small"))
         return elements
 
     def _format_balance_sheet_trends(self, trends) -> List:
         """Format balance sheet trends subsection."""
         elements = []
+        add = elements.append
+        cbp = self.create_bullet_point
+        subsection = self._subsection
 
-        elements.append(self.create_subheader("Balance Sheet Trends"))
-        elements.append(Spacer(1, 0.05 * inch))
+        add(self.create_subheader("Balance Sheet Trends"))
+        add(self.create_spacing("tiny"))
 
         # Basic trend information
-        elements.append(self.create_bullet_point(f"Analysis Period: {trends.years_analyzed} years of data"))
-        elements.append(self.create_bullet_point(f"Analysis Date: {trends.analysis_date}"))
+        add(cbp(f"Analysis Period: {trends.years_analyzed} years of data"))
+        add(cbp(f"Analysis Date: {trends.analysis_date}"))
 
         # Average growth rates
-        elements.append(Spacer(1, 0.05 * inch))
-        elements.append(self.create_subsection_header("Average Annual Growth Rates:"))
+        elements.extend(subsection("Average Annual Growth Rates:"))
         if trends.avg_assets_growth is not None:
-            growth_color = self.get_status_color(trends.avg_assets_growth, (0.03, -0.03))
-            elements.append(self.create_bullet_point(f"  Assets Growth: {self.format_percentage(trends.avg_assets_growth / 100)}", growth_color))
+            growth_color = self.get_status_color(trends.avg_assets_growth, _TH_GROWTH)
+            add(cbp(f"  Assets Growth: {self.format_percentage(trends.avg_assets_growth / 100)}", growth_color))
 
         if trends.avg_equity_growth is not None:
-            growth_color = self.get_status_color(trends.avg_equity_growth, (0.03, -0.03))
-            elements.append(self.create_bullet_point(f"  Equity Growth: {self.format_percentage(trends.avg_equity_growth / 100)}", growth_color))
+            growth_color = self.get_status_color(trends.avg_equity_growth, _TH_GROWTH)
+            add(cbp(f"  Equity Growth: {self.format_percentage(trends.avg_equity_growth / 100)}", growth_color))
 
         if trends.avg_debt_growth is not None:
-            growth_color = self.get_status_color(trends.avg_debt_growth, (0.03, -0.03))
-            elements.append(self.create_bullet_point(f"  Debt Growth: {self.format_percentage(trends.avg_debt_growth / 100)}", growth_color))
+            growth_color = self.get_status_color(trends.avg_debt_growth, _TH_GROWTH)
+            add(cbp(f"  Debt Growth: {self.format_percentage(trends.avg_debt_growth / 100)}", growth_color))
 
         # Trend directions
-        elements.append(Spacer(1, 0.05 * inch))
-        elements.append(self.create_subsection_header("Trend Assessment:"))
-        elements.append(self.create_bullet_point(f"  Assets Trend: {trends.assets_trend.value}"))
-        elements.append(self.create_bullet_point(f"  Equity Trend: {trends.equity_trend.value}"))
-        elements.append(self.create_bullet_point(f"  Debt Trend: {trends.debt_trend.value}"))
-        elements.append(self.create_bullet_point(f"  Leverage Trend: {trends.leverage_trend.value}"))
+        elements.extend(subsection("Trend Assessment:"))
+        trend_values = (trends.assets_trend, trends.equity_trend, trends.debt_trend, trends.leverage_trend)
+        for lines, trend in zip(_TREND_LINES, trend_values):
+            add(cbp(lines[trend]))
 
         # Stability scores
         if trends.balance_sheet_stability_score is not None or trends.leverage_consistency_score is not None:
-            elements.append(Spacer(1, 0.05 * inch))
-            elements.append(self.create_subsection_header("Stability Scores (0-10 scale):"))
+            elements.extend(subsection("Stability Scores (0-10 scale):"))
             if trends.balance_sheet_stability_score is not None:
-                score_color = self.get_status_color(trends.balance_sheet_stability_score, (7.0, 4.0))
-                elements.append(self.create_bullet_point(f"  Balance Sheet Stability: {trends.balance_sheet_stability_score:.1f}/10", score_color))
+                score_color = self.get_status_color(trends.balance_sheet_stability_score, _TH_SCORE)
+                add(cbp("  Balance Sheet Stability: " + _SCORE_FMT(trends.balance_sheet_stability_score), score_color))
 
             if trends.leverage_consistency_score is not None:
-                score_color = self.get_status_color(trends.leverage_consistency_score, (7.0, 4.0))
-                elements.append(self.create_bullet_point(f"  Leverage Consistency: {trends.leverage_consistency_score:.1f}/10", score_color))
+                score_color = self.get_status_color(trends.leverage_consistency_score, _TH_SCORE)
+                add(cbp("  Leverage Consistency: " + _SCORE_FMT(trends.leverage_consistency_score), score_color))
 
         # Historical data table
         if trends.yearly_data:
-            elements.append(Spacer(1, 0.1 * inch))
-            elements.append(self.create_subheader("Historical Balance Sheet Data"))
-
-            # Create table data
-            table_data = [
-                ['Year', 'Assets', 'Equity', 'Debt', 'D/E Ratio']  # Header
-            ]
-
-            for year_data in trends.yearly_data:
-                table_data.append([
-                    str(year_data.year),
-                    self.format_currency(year_data.total_assets, compact=True) if year_data.total_assets else "N/A",
-                    self.format_currency(year_data.total_equity, compact=True) if year_data.total_equity else "N/A",
-                    self.format_currency(year_data.total_debt, compact=True) if year_data.total_debt else "N/A",
-                    self.format_ratio(year_data.debt_to_equity) if year_data.debt_to_equity else "N/A"
-                ])
+            add(self.create_spacing("small"))
+            add(self.create_subheader("Historical Balance Sheet Data"))
+
+            # Split the yearly records into columns and format column by column
+            fr = self.format_ratio
+            currency_column = self._format_currency_column
+            years, assets, equity, debt, debt_to_equity = zip(*map(_YEARLY_COLUMNS, trends.yearly_data))
+
+            # Create table data: header row, then one row per year
+            table_data = [['Year', 'Assets', 'Equity', 'Debt', 'D/E Ratio']]
+            table_data += map(list, zip(
+                map(str, years),
+                currency_column(assets),
+                currency_column(equity),
+                currency_column(debt),
+                [fr(v) if v else "N/A" for v in debt_to_equity]
+            ))
 
             # Create table
             col_widths = [0.6 * inch, 1.0 * inch, 1.0 * inch, 1.0 * inch, 0.8 * inch]
             table = self.create_table(table_data, col_widths)
-            elements.append(table)
+            add(table)
 
-        elements.append(Spacer(1, 0.1 * inch))
+        add(self.create_spacing("small"))
         return elements
 
+    def _format_currency_column(self, values) -> List[str]:
+        """Format a column of amounts compactly, with "N/A" for missing or zero values."""
+        fc = self.format_currency
+        return [fc(v, compact=True) if v else "N/A" for v in values]
+
     def _format_balance_sheet_health(self, assessment: BalanceSheetHealthAssessment) -> List:
         """Format balance sheet health assessment subsection."""
         elements = []
+        add = elements.append
+        cbp = self.create_bullet_point
+        subsection = self._subsection
 
-        elements.append(self.create_subheader("Balance Sheet Health Assessment"))
-        elements.append(Spacer(1, 0.05 * inch))
+        add(self.create_subheader("Balance Sheet Health Assessment"))
+        add(self.create_spacing("tiny"))
 
         # Overall balance sheet health rating
-        if assessment.overall_balance_sheet_rating.value != "Insufficient Data":
-            rating_color = self.get_health_rating_color(assessment.overall_balance_sheet_rating.value)
-            elements.append(self.create_bullet_point(f"Overall Balance Sheet Health: {assessment.overall_balance_sheet_rating.value}", rating_color))
+        if assessment.overall_balance_sheet_rating is not FinancialHealthRating.INSUFFICIENT_DATA:
+            rating_color = self._get_health_rating_color(assessment.overall_balance_sheet_rating)
+            add(cbp(f"Overall Balance Sheet Health: {assessment.overall_balance_sheet_rating.value}", rating_color))
 
             if assessment.overall_balance_sheet_score is not None:
-                score_color = self.get_status_color(assessment.overall_balance_sheet_score, (7.0, 5.0))
-                elements.append(self.create_bullet_point(f"Balance Sheet Score: {assessment.overall_balance_sheet_score:.1f}/10", score_color))
+                score_color = self.get_status_color(assessment.overall_balance_sheet_score, _TH_OVERALL_SCORE)
+                add(cbp("Balance Sheet Score: " + _SCORE_FMT(assessment.overall_balance_sheet_score), score_color))
 
         # Component ratings
         component_ratings = [
@@ -194,36 +272,35 @@ class BalanceSheetFormatter(BasePDFFormatter):
             ("Financial Stability", assessment.financial_stability_health, assessment.financial_stability_score)
         ]
 
-        has_component_data = any(rating.value != "Insufficient Data" for _, rating, _ in component_ratings)
-
-        if has_component_data:
-            elements.append(Spacer(1, 0.05 * inch))
-            elements.append(self.create_subsection_header("Component Health Ratings:"))
+        bullets = []
+        for name, rating, score in component_ratings:
+            if rating is FinancialHealthRating.INSUFFICIENT_DATA:
+                continue
+            rating_color = self._get_health_rating_color(rating)
+            parts = ['  ', name, ': ', rating.value]
+            if score is not None:
+                parts += (" (", _SCORE_FMT(score), ")")
+            bullets.append(cbp(''.join(parts), rating_color))
 
-            for name, rating, score in component_ratings:
-                if rating.value != "Insufficient Data":
-                    rating_color = self.get_health_rating_color(rating.value)
-                    score_text = f" ({score:.1f}/10)" if score is not None else ""
-                    elements.append(self.create_bullet_point(f"  {name}: {rating.value}{score_text}", rating_color))
+        if bullets:
+            elements.extend(subsection("Component Health Ratings:"))
+            elements.extend(bullets)
 
         # Strengths and concerns
         if assessment.strengths:
-            elements.append(Spacer(1, 0.05 * inch))
-            elements.append(self.create_subsection_header("Balance Sheet Strengths:"))
-            for strength in assessment.strengths:
-                elements.append(self.create_bullet_point(f"  • {strength}", self.colors.SUCCESS_GREEN))
+            elements.extend(subsection("Balance Sheet Strengths:"))
+            green = self._green
+            elements.extend([cbp(text, green) for text in map(_LIST_ITEM_FMT, assessment.strengths)])
 
         if assessment.concerns:
-            elements.append(Spacer(1, 0.05 * inch))
-            elements.append(self.create_subsection_header("Balance Sheet Concerns:"))
-            for concern in assessment.concerns:
-                elements.append(self.create_bullet_point(f"  • {concern}", self.colors.WARNING_RED))
+            elements.extend(subsection("Balance Sheet Concerns:"))
+            red = self._red
+            elements.extend([cbp(text, red) for text in map(_LIST_ITEM_FMT, assessment.concerns)])
 
         # Summary
         if assessment.summary:
-            elements.append(Spacer(1, 0.05 * inch))
-            elements.append(self.create_subsection_header("Balance Sheet Summary:"))
-            elements.append(self.create_bullet_point(f"  {assessment.summary}"))
+            elements.extend(subsection("Balance Sheet Summary:"))
+            add(cbp(f"  {assessment.summary}"))
 
-        elements.append(Spacer(1, 0.2 * inch))
+        add(self.create_spacing("large"))
         return elements
@@ -5,20 +5,93 @@ This module provides the base class and common utilities for PDF formatting,
 including colors, fonts, and shared formatting functions.
 """
 
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from bisect import bisect_right
+from functools import lru_cache
+import re
+from typing import List, Tuple, Optional, Sequence
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import Table, TableStyle, Paragraph, Spacer, HRFlowable
+from reportlab.platypus.paragraph import cleanBlockQuotedText
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 
-@dataclass
+# Compact notation thresholds (inclusive '>=') and the (divisor, suffix)
+# each bucket maps to
+_COMPACT_THRESHOLDS = (1e3, 1e6, 1e9)
+_COMPACT_UNITS = ((1e3, "K"), (1e6, "M"), (1e9, "B"))
+
+@lru_cache(maxsize=4096)
+def _cached_fmt_two(value: float) -> str:
+    return f"{value:.2f}"
+
+
+def _fmt_two(value: float) -> str:
+    """Format a value with two decimals, memoizing the recurring ones."""
+    # -0.0 shares 0.0's cache key but formats as "-0.00", so zeros skip the cache
+    return _cached_fmt_two(value) if value else f"{value:.2f}"
+
+
+# Below-threshold formatting for volumes (no decimals, thousands separators)
+_fmt_whole = "{:,.0f}".format
+
+
+def _render_compact(value: float, bucket: int, show_sign: bool = False, plain=_fmt_two) -> str:
+    """Render a value in the unit of its _COMPACT_THRESHOLDS bucket (0 for plain formatting)."""
+    sign = "+" if show_sign and value > 0 else ""
+    if bucket:
+        divisor, suffix = _COMPACT_UNITS[bucket - 1]
+        return f"{sign}{value/divisor:.1f}{suffix}"
+    return f"{sign}{plain(value)}"
+
+
+def _render_percentage(value: float, show_sign: bool = False) -> str:
+    """Render an already scaled percentage value."""
+    sign = "+" if show_sign and value > 0 else ""
+    return f"{sign}{_fmt_two(value)}%"
+
+
+# Stylesheet shared by all formatters, built by the first _setup_styles call
+_BASE_STYLES = None
+
+# Spacer heights for create_spacing by size keyword
+_SPACING_SIZES = {
+    "tiny": 0.05 * inch,
+    "small": 0.1 * inch,
+    "normal": 0.15 * inch,
+    "large": 0.2 * inch,
+    "xlarge": 0.3 * inch,
+    "section": 0.25 * inch
+}
+
+# Names of TrueType fonts already registered with ReportLab in this process
+_registered_fonts = set()
+
+
+def _ensure_font(name: str, path: str) -> None:
+    """
+    Register a TrueType font once per process.
+
+    Registration parses the font file, so repeated calls for the same name
+    (e.g. one formatter per ticker) are no-ops.
+
+    Args:
+        name: Font name to register under
+        path: Path to the .ttf file
+    """
+    if name in _registered_fonts:
+        return
+    pdfmetrics.registerFont(TTFont(name, path))
+    _registered_fonts.add(name)
+
+
 class PDFColors:
     """Enhanced color constants for professional PDF formatting."""
+    __slots__ = ()  # Constants live on the class; instances carry no state
+
     # Status colors - more sophisticated palette
     SUCCESS_GREEN = colors.Color(0.15, 0.6, 0.3)    # Professional green
     WARNING_RED = colors.Color(0.8, 0.25, 0.2)      # Professional red
@@ -50,9 +123,81 @@ class PDFColors:
     HEADER_BLUE = ACCENT_BACKGROUND
 
 
-@dataclass
+def _hex_code(color: colors.Color) -> str:
+    """Convert a color to an HTML hex code such as "#26994c"."""
+    r, g, b = int(color.red * 255), int(color.green * 255), int(color.blue * 255)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+# HTML hex codes for the palette, computed once for all formatters
+_PALETTE_HEX = {
+    value: _hex_code(value)
+    for value in vars(PDFColors).values()
+    if isinstance(value, colors.Color)
+}
+
+# get_status_color palette, indexed by 2 * (value >= good) + (not value <= bad)
+_STATUS_PALETTE = (
+    PDFColors.WARNING_RED,
+    PDFColors.CAUTION_YELLOW,
+    PDFColors.SUCCESS_GREEN,
+    PDFColors.SUCCESS_GREEN
+)
+
+
+# Color lookups for signal, trend and rating strings. Reports repeat a handful
+# of enum values, so results are memoized on the raw string. Each term set is
+# one alternation, matched anywhere in the lowercased value.
+_SIGNAL_BUY = re.compile(r'strong_buy|buy|bullish')
+_SIGNAL_SELL = re.compile(r'strong_sell|sell|bearish')
+_TREND_UP = re.compile(r'strong_uptrend|uptrend|bullish')
+_TREND_DOWN = re.compile(r'strong_downtrend|downtrend|bearish')
+_RATING_GOOD = re.compile(r'excellent|good')
+_RATING_POOR = re.compile(r'poor|weak|insufficient')
+
+
+@lru_cache(maxsize=64)
+def _signal_color(signal_value: Optional[str]) -> colors.Color:
+    signal_lower = signal_value.lower() if signal_value else ""
+
+    if _SIGNAL_BUY.search(signal_lower):
+        return PDFColors.SUCCESS_GREEN
+    elif _SIGNAL_SELL.search(signal_lower):
+        return PDFColors.WARNING_RED
+    else:
+        return PDFColors.CAUTION_YELLOW
+
+
+@lru_cache(maxsize=64)
+def _trend_color(trend_value: Optional[str]) -> colors.Color:
+    trend_lower = trend_value.lower() if trend_value else ""
+
+    if _TREND_UP.search(trend_lower):
+        return PDFColors.SUCCESS_GREEN
+    elif _TREND_DOWN.search(trend_lower):
+        return PDFColors.WARNING_RED
+    else:
+        return PDFColors.CAUTION_YELLOW
+
+
+@lru_cache(maxsize=64)
+def _health_rating_color(rating_value: Optional[str]) -> colors.Color:
+    rating_lower = rating_value.lower() if rating_value else ""
+
+    if _RATING_GOOD.search(rating_lower):
+        return PDFColors.SUCCESS_GREEN
+    elif 'fair' in rating_lower:
+        return PDFColors.CAUTION_YELLOW
+    elif _RATING_POOR.search(rating_lower):
+        return PDFColors.WARNING_RED
+    else:
+        return PDFColors.PRIMARY_TEXT
+
+
 class PDFFonts:
     """Enhanced font system with professional typography."""
+    __slots__ = ()  # Constants live on the class; instances carry no state
+
     # Font families
     PRIMARY = "Helvetica"
     TITLE = "Helvetica-Bold"
@@ -80,21 +225,55 @@ class PDFFonts:
 class BasePDFFormatter:
     """
     Base class for PDF formatters with common utilities and formatting functions.
+
+    Formatters needing custom TrueType fonts must register them through
+    _ensure_font rather than pdfmetrics.registerFont directly, so creating
+    many formatters does not re-parse the font files.
     """
 
+    # Default table style, shared by every table that adds no commands of its own
+    _DEFAULT_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), PDFColors.LIGHT_GRAY),
+        ('TEXTCOLOR', (0, 0), (-1, 0), PDFColors.BLACK),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), PDFFonts.BOLD),
+        ('FONTSIZE', (0, 0), (-1, 0), PDFFonts.NORMAL_SIZE),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), PDFColors.WHITE),
+        ('GRID', (0, 0), (-1, -1), 1, PDFColors.GRAY),
+        ('FONTNAME', (0, 1), (-1, -1), PDFFonts.NORMAL),
+        ('FONTSIZE', (0, 1), (-1, -1), PDFFonts.SMALL_SIZE),
+    ])
+
     def __init__(self):
         """Initialize the base PDF formatter."""
-        self.colors = PDFColors()
-        self.fonts = PDFFonts()
+        # Constant namespaces, shared by reference rather than instantiated
+        self.colors = PDFColors
+        self.fonts = PDFFonts
         self.page_width, self.page_height = A4  # Use A4 for better international compatibility
         self.margin = 0.75 * inch
         self.content_width = self.page_width - 2 * self.margin
 
         # Initialize styles
         self._setup_styles()
+        self._style_cache = {}
+        self._metric_frags = {}
+        self._plain_frags = {}
+        self._colored_default_style = self._get_or_build_style(
+            'ColoredNormal', 'CustomNormal',
+            textColor=self.colors.BLACK
+        )
+
+        # HTML hex codes for the palette, extended on demand by _color_to_hex
+        self._hex_by_color = dict(_PALETTE_HEX)
 
     def _setup_styles(self):
         """Set up enhanced paragraph styles for professional formatting."""
+        global _BASE_STYLES
+        if _BASE_STYLES is not None:
+            self.styles = _BASE_STYLES
+            return
+
         self.styles = getSampleStyleSheet()
 
         # Title style - enhanced
@@ -171,6 +350,19 @@ class BasePDFFormatter:
             leftIndent=10
         ))
 
+        # Professional section header style - title casing applied by the style
+        self.styles.add(ParagraphStyle(
+            name='ProfessionalHeader',
+            fontName=self.fonts.HEADER,
+            fontSize=self.fonts.HEADER_SIZE,
+            textColor=self.colors.ACCENT_BACKGROUND,
+            spaceAfter=8,
+            spaceBefore=4,
+            textTransform='uppercase'
+        ))
+
+        _BASE_STYLES = self.styles
+
     def create_colored_paragraph(self, text: str, color: colors.Color = None) -> Paragraph:
         """
         Create a paragraph with optional color.
@@ -182,13 +374,36 @@ class BasePDFFormatter:
         Returns:
             Paragraph object
         """
-        style = ParagraphStyle(
-            name='ColoredNormal',
-            parent=self.styles['CustomNormal'],
-            textColor=color or self.colors.BLACK
+        if not color:
+            return Paragraph(text, self._colored_default_style)
+
+        style = self._get_or_build_style(
+            'ColoredNormal', 'CustomNormal',
+            textColor=color
         )
         return Paragraph(text, style)
 
+    def _get_or_build_style(self, name: str, parent: Optional[str] = None, **attributes) -> ParagraphStyle:
+        """
+        Get a derived paragraph style, building it on first use.
+
+        Args:
+            name: Style name
+            parent: Optional name of the stylesheet style to inherit from
+            **attributes: Style attributes to set (values must be hashable)
+
+        Returns:
+            ParagraphStyle shared by all callers asking for the same style
+        """
+        key = (name, parent, tuple(sorted(attributes.items())))
+        style = self._style_cache.get(key)
+        if style is None:
+            if parent is not None:
+                attributes['parent'] = self.styles[parent]
+            style = ParagraphStyle(name=name, **attributes)
+            self._style_cache[key] = style
+        return style
+
     def create_table(self, data: List[List], col_widths: List[float] = None,
                     style_commands: List = None) -> Table:
         """
@@ -204,26 +419,13 @@ class BasePDFFormatter:
         """
         table = Table(data, colWidths=col_widths)
 
-        # Default style
-        default_style = TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.colors.LIGHT_GRAY),
-            ('TEXTCOLOR', (0, 0), (-1, 0), self.colors.BLACK),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), self.fonts.BOLD),
-            ('FONTSIZE', (0, 0), (-1, 0), self.fonts.NORMAL_SIZE),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), self.colors.WHITE),
-            ('GRID', (0, 0), (-1, -1), 1, self.colors.GRAY),
-            ('FONTNAME', (0, 1), (-1, -1), self.fonts.NORMAL),
-            ('FONTSIZE', (0, 1), (-1, -1), self.fonts.SMALL_SIZE),
-        ])
-
-        # Apply custom style commands if provided
+        # Apply custom style commands on top of a copy of the default style
         if style_commands:
-            for cmd in style_commands:
-                default_style.add(*cmd)
+            style = TableStyle([tuple(cmd) for cmd in style_commands], parent=self._DEFAULT_TABLE_STYLE)
+        else:
+            style = self._DEFAULT_TABLE_STYLE
 
-        table.setStyle(default_style)
+        table.setStyle(style)
         return table
 
     def format_currency(self, value: Optional[float], compact: bool = False, show_sign: bool = False) -> str:
@@ -238,19 +440,7 @@ class BasePDFFormatter:
         Returns:
             Formatted currency string
         """
-        if value is None:
-            return "N/A"
-
-        sign = "+" if show_sign and value > 0 else ""
-
-        if compact and abs(value) >= 1e9:
-            return f"{sign}{value/1e9:.1f}B"
-        elif compact and abs(value) >= 1e6:
-            return f"{sign}{value/1e6:.1f}M"
-        elif compact and abs(value) >= 1e3:
-            return f"{sign}{value/1e3:.1f}K"
-        else:
-            return f"{sign}{value:.2f}"
+        return self._compact_format(value, compact=compact, show_sign=show_sign)
 
     def format_percentage(self, value: Optional[float], show_sign: bool = False, multiply_by_100: bool = True) -> str:
         """
@@ -271,8 +461,7 @@ class BasePDFFormatter:
         if multiply_by_100:
             value *= 100
 
-        sign = "+" if show_sign and value > 0 else ""
-        return f"{sign}{value:.2f}%"
+        return _render_percentage(value, show_sign)
 
     def format_ratio(self, value: Optional[float]) -> str:
         """
@@ -286,7 +475,7 @@ class BasePDFFormatter:
         """
         if value is None:
             return "N/A"
-        return f"{value:.2f}"
+        return _fmt_two(value)
 
     def format_volume(self, value: Optional[float]) -> str:
         """
@@ -298,17 +487,32 @@ class BasePDFFormatter:
         Returns:
             Formatted volume string
         """
+        return self._compact_format(value, allow_negative=False, plain=_fmt_whole)
+
+    def _compact_format(self, value: Optional[float], compact: bool = True, show_sign: bool = False,
+                        allow_negative: bool = True, plain=_fmt_two) -> str:
+        """
+        Format a value in K/M/B notation, shared by format_currency and format_volume.
+
+        Args:
+            value: Numeric value
+            compact: Use compact notation for large numbers
+            show_sign: Whether to show + for positive values
+            allow_negative: Compact large negative values by magnitude
+            plain: Formatter for values left out of compact notation
+
+        Returns:
+            Formatted string
+        """
         if value is None:
             return "N/A"
 
-        if value >= 1e9:
-            return f"{value/1e9:.1f}B"
-        elif value >= 1e6:
-            return f"{value/1e6:.1f}M"
-        elif value >= 1e3:
-            return f"{value/1e3:.1f}K"
-        else:
-            return f"{value:,.0f}"
+        bucket = 0
+        if compact:
+            magnitude = abs(value) if allow_negative else value
+            if magnitude >= 1e3:
+                bucket = bisect_right(_COMPACT_THRESHOLDS, magnitude)
+        return _render_compact(value, bucket, show_sign, plain)
 
     def format_eps(self, value: Optional[float]) -> str:
         """
@@ -322,7 +526,7 @@ class BasePDFFormatter:
         """
         if value is None:
             return "N/A"
-        return f"{value:.2f}"
+        return _fmt_two(value)
 
     def get_status_color(self, value: float, thresholds: Tuple[float, float]) -> colors.Color:
         """
@@ -336,13 +540,7 @@ class BasePDFFormatter:
             Color based on thresholds
         """
         good_threshold, bad_threshold = thresholds
-
-        if value >= good_threshold:
-            return self.colors.SUCCESS_GREEN
-        elif value <= bad_threshold:
-            return self.colors.WARNING_RED
-        else:
-            return self.colors.CAUTION_YELLOW
+        return _STATUS_PALETTE[(value >= good_threshold) * 2 + (not value <= bad_threshold)]
 
     def get_score_color(self, score: float, excellent_threshold: float = 8.0,
                        good_threshold: float = 6.0, fair_threshold: float = 4.0) -> colors.Color:
@@ -377,14 +575,7 @@ class BasePDFFormatter:
         Returns:
             Color based on signal type
         """
-        signal_lower = signal_value.lower() if signal_value else ""
-
-        if any(term in signal_lower for term in ['strong_buy', 'buy', 'bullish']):
-            return self.colors.SUCCESS_GREEN
-        elif any(term in signal_lower for term in ['strong_sell', 'sell', 'bearish']):
-            return self.colors.WARNING_RED
-        else:
-            return self.colors.CAUTION_YELLOW
+        return _signal_color(signal_value)
 
     def get_trend_color(self, trend_value: str) -> colors.Color:
         """
@@ -396,14 +587,7 @@ class BasePDFFormatter:
         Returns:
             Color based on trend direction
         """
-        trend_lower = trend_value.lower() if trend_value else ""
-
-        if any(term in trend_lower for term in ['strong_uptrend', 'uptrend', 'bullish']):
-            return self.colors.SUCCESS_GREEN
-        elif any(term in trend_lower for term in ['strong_downtrend', 'downtrend', 'bearish']):
-            return self.colors.WARNING_RED
-        else:
-            return self.colors.CAUTION_YELLOW
+        return _trend_color(trend_value)
 
     def get_health_rating_color(self, rating_value: str) -> colors.Color:
         """
@@ -415,18 +599,7 @@ class BasePDFFormatter:
         Returns:
             Color based on rating
         """
-        rating_lower = rating_value.lower() if rating_value else ""
-
-        if 'excellent' in rating_lower:
-            return self.colors.SUCCESS_GREEN
-        elif 'good' in rating_lower:
-            return self.colors.SUCCESS_GREEN
-        elif 'fair' in rating_lower:
-            return self.colors.CAUTION_YELLOW
-        elif any(term in rating_lower for term in ['poor', 'weak', 'insufficient']):
-            return self.colors.WARNING_RED
-        else:
-            return self.colors.PRIMARY_TEXT
+        return _health_rating_color(rating_value)
 
     def create_section_header(self, title: str) -> Paragraph:
         """
@@ -438,7 +611,7 @@ class BasePDFFormatter:
         Returns:
             Paragraph object
         """
-        return Paragraph(title, self.styles['CustomHeader'])
+        return self._plain_paragraph(title, self.styles['CustomHeader'])
 
     def create_subheader(self, title: str) -> Paragraph:
         """
@@ -450,7 +623,7 @@ class BasePDFFormatter:
         Returns:
             Paragraph object
         """
-        return Paragraph(title, self.styles['CustomSubheader'])
+        return self._plain_paragraph(title, self.styles['CustomSubheader'])
 
     def create_bullet_point(self, text: str, color: colors.Color = None) -> Paragraph:
         """
@@ -463,14 +636,15 @@ class BasePDFFormatter:
         Returns:
             Paragraph object
         """
-        style = ParagraphStyle(
-            name='BulletPoint',
-            parent=self.styles['CustomNormal'],
+        style = self._get_or_build_style(
+            'BulletPoint', 'CustomNormal',
             leftIndent=20,
             bulletIndent=10,
             textColor=color or self.colors.PRIMARY_TEXT
         )
-        return Paragraph(f"• {text}", style)
+        # The glyph stays inline rather than as bulletText, which would hang it
+        # at bulletIndent in the bullet font and move the body text
+        return self._plain_paragraph(f"• {text}", style)
 
     def create_professional_section_header(self, title: str, icon: str = None) -> List:
         """
@@ -494,16 +668,7 @@ class BasePDFFormatter:
         elements.append(Spacer(1, 0.15 * inch))
 
         # Create header with professional styling
-        header_style = ParagraphStyle(
-            name='ProfessionalHeader',
-            fontName=self.fonts.HEADER,
-            fontSize=self.fonts.HEADER_SIZE,
-            textColor=self.colors.ACCENT_BACKGROUND,
-            spaceAfter=8,
-            spaceBefore=4
-        )
-
-        elements.append(Paragraph(clean_title.upper(), header_style))
+        elements.append(Paragraph(clean_title, self.styles['ProfessionalHeader']))
 
         # Add subtle underline
         elements.append(HRFlowable(
@@ -521,21 +686,14 @@ class BasePDFFormatter:
         Create consistent spacing elements.
 
         Args:
-            size: Spacing size ("small", "normal", "large", "xlarge")
+            size: Spacing size ("tiny", "small", "normal", "large", "xlarge", "section")
 
         Returns:
             Spacer object
         """
-        sizes = {
-            "tiny": 0.05 * inch,
-            "small": 0.1 * inch,
-            "normal": 0.15 * inch,
-            "large": 0.2 * inch,
-            "xlarge": 0.3 * inch,
-            "section": 0.25 * inch
-        }
-
-        height = sizes.get(size, sizes["normal"])
+        # A new Spacer per call: the doc template tracks page-break
+        # postponement on each flowable instance, so spacers cannot be shared
+        height = _SPACING_SIZES.get(size, _SPACING_SIZES["normal"])
         return Spacer(1, height)
 
 
@@ -550,7 +708,50 @@ class BasePDFFormatter:
         Returns:
             Paragraph object with subsection header styling
         """
-        return Paragraph(text, self.styles['SubsectionHeader'])
+        return self._plain_paragraph(text, self.styles['SubsectionHeader'])
+
+    def _plain_paragraph(self, text: str, style: ParagraphStyle) -> Paragraph:
+        """
+        Create a paragraph from markup-free text without running the parser.
+
+        Whitespace is collapsed with the same cleaner Paragraph applies;
+        text with markup or entities falls back to a regular Paragraph.
+
+        Args:
+            text: Paragraph text
+            style: Paragraph style
+
+        Returns:
+            Paragraph object
+        """
+        if '<' not in text and '&' not in text:
+            template = self._plain_frags.get(style)
+            if template is None:
+                template = self._parse_plain_template(style)
+            cleaned = cleanBlockQuotedText(text)
+            if template and cleaned:
+                return Paragraph(cleaned, style, frags=[template.clone(text=cleaned)])
+        return Paragraph(text, style)
+
+    def _parse_plain_template(self, style: ParagraphStyle):
+        """
+        Parse a one-word paragraph once to get the plain text fragment of a style.
+
+        Args:
+            style: Paragraph style
+
+        Returns:
+            The parsed fragment, or False if the style transforms text
+        """
+        frags = Paragraph('X', style).frags
+        reusable = (
+            not getattr(style, 'textTransform', None)
+            and len(frags) == 1
+            and frags[0].text == 'X'
+        )
+        template = frags[0] if reusable else False
+        self._plain_frags[style] = template
+        return template
 
     def create_metric_display(self, label: str, value: str, status_color: colors.Color = None) -> Paragraph:
         """
@@ -564,25 +765,103 @@ class BasePDFFormatter:
         Returns:
             Paragraph object
         """
-        if status_color:
-            # Add a small colored indicator using ReportLab color format
-            # Convert RGB values to hex format for HTML
-            r, g, b = int(status_color.red * 255), int(status_color.green * 255), int(status_color.blue * 255)
-            hex_color = f"#{r:02x}{g:02x}{b:02x}"
-            indicator = f'<font color="{hex_color}">●</font> '
-            styled_text = f'{indicator}<b>{label}:</b> {value}'
-        else:
-            styled_text = f'<b>{label}:</b> {value}'
+        return self._metric_paragraph(label, value, status_color, self._metric_display_style())
 
-        style = ParagraphStyle(
-            name='MetricDisplay',
-            parent=self.styles['CustomNormal'],
+    def build_metric_paragraphs(self, rows: Sequence[Tuple[str, str, Optional[colors.Color]]]) -> List[Paragraph]:
+        """
+        Create metric displays for a column of metrics, matching create_metric_display per row.
+
+        Args:
+            rows: Sequence of (label, value, color) tuples
+
+        Returns:
+            List of Paragraph objects
+        """
+        style = self._metric_display_style()
+        metric_paragraph = self._metric_paragraph
+        return [metric_paragraph(label, value, color, style) for label, value, color in rows]
+
+    def _metric_display_style(self) -> ParagraphStyle:
+        """Get the cached paragraph style used for metric displays."""
+        return self._get_or_build_style(
+            'MetricDisplay', 'CustomNormal',
             spaceAfter=8,
             leftIndent=10
         )
 
+    def _metric_paragraph(self, label: str, value: str, status_color: Optional[colors.Color],
+                          style: ParagraphStyle) -> Paragraph:
+        """
+        Create a metric display paragraph with an already resolved style.
+
+        Args:
+            label: Metric label
+            value: Metric value
+            status_color: Optional status indicator color
+            style: Metric display paragraph style
+
+        Returns:
+            Paragraph object
+        """
+        if status_color:
+            # Add a small colored indicator using ReportLab color format
+            hex_color = self._hex_by_color.get(status_color) or self._color_to_hex(status_color)
+            prefix = f'<font color="{hex_color}">●</font> <b>{label}:</b>'
+        else:
+            prefix = f'<b>{label}:</b>'
+        styled_text = f'{prefix} {value}'
+
+        # Skip the markup parser when the value is plain text it would pass
+        # through unchanged: reuse the label's parsed fragments instead
+        if value and '<' not in value and '&' not in value and cleanBlockQuotedText(value) == value:
+            template = self._metric_frags.get(prefix)
+            if template is None:
+                template = self._parse_metric_template(prefix, style)
+            if template:
+                frags = [frag.clone() for frag in template]
+                frags[-1].text = ' ' + value
+                return Paragraph(styled_text, style, frags=frags)
+
         return Paragraph(styled_text, style)
 
+    def _parse_metric_template(self, prefix: str, style: ParagraphStyle) -> tuple:
+        """
+        Parse a metric display prefix once and cache its fragments.
+
+        Args:
+            prefix: Indicator and bold label markup preceding the value
+            style: Paragraph style the metric is rendered with
+
+        Returns:
+            Parsed fragments ending with the value fragment, or an empty tuple
+            if the prefix cannot be reused verbatim
+        """
+        sample = f'{prefix} X'
+        paragraph = Paragraph(sample, style)
+        frags = paragraph.frags
+        reusable = (
+            paragraph.text == sample
+            and not getattr(style, 'textTransform', None)
+            and frags[-1].text == ' X'
+        )
+        template = tuple(frags) if reusable else ()
+        self._metric_frags[prefix] = template
+        return template
+
+    def _color_to_hex(self, color: colors.Color) -> str:
+        """
+        Convert a color to an HTML hex code and remember it.
+
+        Args:
+            color: ReportLab color
+
+        Returns:
+            Hex color string such as "#26994c"
+        """
+        hex_color = _hex_code(color)
+        self._hex_by_color[color] = hex_color
+        return hex_color
+
     def create_standard_section(self, title: str, metrics: List[Tuple[str, str, Optional[colors.Color]]],
                                subheader: str = None) -> List:
         """
@@ -607,8 +886,7 @@ class BasePDFFormatter:
             elements.append(self.create_spacing("small"))
 
         # Add metrics
-        for label, value, color in metrics:
-            elements.append(self.create_metric_display(label, value, color))
+        elements.extend(self.build_metric_paragraphs(metrics))
 
         # Add section spacing
         elements.append(self.create_spacing("section"))
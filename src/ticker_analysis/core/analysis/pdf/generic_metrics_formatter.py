@@ -137,12 +137,14 @@ class GenericMetricsFormatter(BasePDFFormatter):
         elements.extend(self.create_professional_section_header(config.title))
 
         # Add metrics
+        rows = []
         for metric in config.metrics:
             value = getattr(data, metric.value_attr, None)
             if value is not None:
                 formatted_value = metric.formatter(value)
                 color = metric.color_logic(value) if metric.color_logic else None
-                elements.append(self.create_metric_display(metric.label, formatted_value, color))
+                rows.append((metric.label, formatted_value, color))
+        elements.extend(self.build_metric_paragraphs(rows))
 
         # Add section spacing
         elements.append(self.create_spacing("section"))
@@ -8,7 +8,6 @@ to generate a comprehensive PDF analysis report.
 from typing import List, Optional
 from datetime import datetime
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, PageBreak, Spacer, Paragraph
 from reportlab.lib import colors
@@ -80,8 +79,8 @@ class PDFFormatter(BasePDFFormatter):
         story.append(Spacer(1, 1 * inch))
 
         # Main title with enhanced styling
-        title_style = ParagraphStyle(
-            name='TitlePageTitle',
+        title_style = self._get_or_build_style(
+            'TitlePageTitle',
             fontName=self.fonts.BOLD,
             fontSize=24,
             textColor=self.colors.PRIMARY_TEXT,
@@ -93,8 +92,8 @@ class PDFFormatter(BasePDFFormatter):
         story.append(Paragraph("COMPANY ANALYSIS REPORT", title_style))
 
         # Company ticker with prominent styling
-        ticker_style = ParagraphStyle(
-            name='TitlePageTicker',
+        ticker_style = self._get_or_build_style(
+            'TitlePageTicker',
             fontName=self.fonts.BOLD,
             fontSize=32,
             textColor=self.colors.ACCENT_BACKGROUND,
@@ -107,8 +106,8 @@ class PDFFormatter(BasePDFFormatter):
 
         # Generation info with professional styling
         generation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        info_style = ParagraphStyle(
-            name='TitlePageInfo',
+        info_style = self._get_or_build_style(
+            'TitlePageInfo',
             fontName=self.fonts.NORMAL,
             fontSize=self.fonts.SMALL_SIZE,
             textColor=self.colors.SECONDARY_TEXT,
@@ -120,8 +119,8 @@ class PDFFormatter(BasePDFFormatter):
 
         # Company basic info with improved formatting
         if analysis_data.exchange or analysis_data.sector:
-            basic_info_style = ParagraphStyle(
-                name='TitlePageBasicInfo',
+            basic_info_style = self._get_or_build_style(
+                'TitlePageBasicInfo',
                 fontName=self.fonts.NORMAL,
                 fontSize=self.fonts.NORMAL_SIZE,
                 textColor=self.colors.PRIMARY_TEXT,
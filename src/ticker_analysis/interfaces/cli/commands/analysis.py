@@ -8,7 +8,6 @@ from typing import List
 from .base import BaseCommand
 from ....core.data.fetchers import CompanyInfoFetcher, DividendFetcher, IncomeStatementFetcher, BalanceSheetFetcher, CashFlowFetcher, PriceFetcher, DataFrequency, TimePeriod
 from ....core.analysis.formatter import display_comprehensive_analysis
-from ....core.analysis.pdf import PDFFormatter
 from ....core.analysis.models import CompanyAnalysisData
 from ....core.analysis.dividend import DividendAnalyzer
 from ....core.analysis.income_statement import CompanyIncomeStatementAnalyzer
@@ -298,6 +297,8 @@ class AnalysisCommand(BaseCommand):
             
             # Display the comprehensive analysis or generate PDF
             if pdf_filename:
+                # ReportLab is slow to import, so only load it when exporting
+                from ....core.analysis.pdf import PDFFormatter
                 try:
                     self.logger.info(f"Generating PDF report: {pdf_filename}")
                     pdf_formatter = PDFFormatter()
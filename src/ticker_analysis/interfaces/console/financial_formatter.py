@@ -5,11 +5,24 @@ This module provides specialized formatting functions for financial data
 including currency, percentages, shares, and other financial metrics.
 """
 
+from functools import lru_cache
+from math import copysign
 from typing import Optional, Union
 from decimal import Decimal
 from .styles import Colors
 
 
+@lru_cache(maxsize=4096)
+def _render_cached(settings: tuple, renderer: str, num_value: float, zero_sign: float, *options) -> str:
+    """
+    Render an already validated float with a formatter's settings, memoized.
+
+    zero_sign is part of the key because -0.0 == 0.0 would otherwise share
+    an entry, although the two format differently.
+    """
+    return getattr(FinancialFormatter(*settings), renderer)(num_value, *options)
+
+
 class FinancialFormatter:
     """Handles formatting of financial data for console display."""
     
@@ -24,6 +37,13 @@ class FinancialFormatter:
         self.use_colors = use_colors
         self.currency_symbol = currency_symbol
     
+    def _render(self, renderer: str, num_value: float, *options) -> str:
+        """Render a validated float through the cache shared by formatters with the same settings."""
+        return _render_cached(
+            (self.use_colors, self.currency_symbol), renderer,
+            num_value, copysign(1.0, num_value), *options
+        )
+    
     def colorize(self, text: str, color: str) -> str:
         """
         Apply color to text if colors are enabled.
@@ -66,6 +86,10 @@ class FinancialFormatter:
         except (ValueError, TypeError):
             return self.colorize("N/A", Colors.DIM)
         
+        return self._render('_render_currency', num_value, precision, show_sign, compact)
+    
+    def _render_currency(self, num_value: float, precision: int, show_sign: bool, compact: bool) -> str:
+        """Format a validated currency value (see format_currency)."""
         # Handle compact notation
         if compact:
             return self._format_compact_currency(num_value, precision, show_sign)
@@ -158,6 +182,10 @@ class FinancialFormatter:
         except (ValueError, TypeError):
             return self.colorize("N/A", Colors.DIM)
         
+        return self._render('_render_percentage', num_value, precision, show_sign, multiply_by_100)
+    
+    def _render_percentage(self, num_value: float, precision: int, show_sign: bool, multiply_by_100: bool) -> str:
+        """Format a validated percentage value (see format_percentage)."""
         # Convert to percentage if needed
         if multiply_by_100:
             num_value *= 100
@@ -173,6 +201,31 @@ class FinancialFormatter:
         else:
             return self.colorize(formatted, Colors.WHITE)
     
+    def format_signed_percent_from_pct(self, value: Optional[Union[float, int, Decimal]]) -> str:
+        """
+        Format a value already expressed in percent (e.g. 2.5 -> +2.50%) with its sign.
+        
+        Args:
+            value: Percentage value to format (not a decimal fraction)
+            
+        Returns:
+            Formatted percentage string with explicit + for positive values
+        """
+        if value is None:
+            return self.colorize("N/A", Colors.DIM)
+        
+        try:
+            num_value = float(value)
+        except (ValueError, TypeError):
+            return self.colorize("N/A", Colors.DIM)
+        
+        if num_value > 0:
+            return self.colorize(f"+{num_value:.2f}%", Colors.GREEN)
+        elif num_value < 0:
+            return self.colorize(f"{num_value:.2f}%", Colors.RED)
+        else:
+            return self.colorize(f"{num_value:.2f}%", Colors.WHITE)
+    
     def format_shares(
         self, 
         value: Optional[Union[float, int, Decimal]], 
@@ -260,6 +313,10 @@ class FinancialFormatter:
         except (ValueError, TypeError):
             return self.colorize("N/A", Colors.DIM)
         
+        return self._render('_render_ratio', num_value, precision, show_sign)
+    
+    def _render_ratio(self, num_value: float, precision: int, show_sign: bool) -> str:
+        """Format a validated ratio value (see format_ratio)."""
         sign = "+" if show_sign and num_value > 0 else ""
         formatted = f"{sign}{num_value:.{precision}f}"
         
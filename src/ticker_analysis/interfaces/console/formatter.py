@@ -6,10 +6,14 @@ import sys
 import os
 import re
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from .styles import Colors, LogLevelColors, Symbols
 
 
+# str.format alignment specifiers for table column alignments
+_ALIGN_SPECS = {'left': '<', 'right': '>', 'center': '^'}
+
+
 class ConsoleFormatter:
     """Handles console text formatting with colors and styles."""
     
@@ -242,4 +246,43 @@ class ConsoleFormatter:
         for col, width, align in zip(columns, widths, alignments):
             formatted_columns.append(self.pad_with_ansi(str(col), width, align))
         
-        return ' '.join(formatted_columns)
\ No newline at end of file
+        return ' '.join(formatted_columns)
+    
+    def format_table_rows(self, rows: List[list], widths: list, alignments: list = None) -> List[str]:
+        """
+        Format several table rows sharing the same column layout.
+        
+        The widths and alignments are validated once and compiled into a
+        str.format template; rows containing ANSI codes fall back to the
+        ANSI-aware padding of format_table_row.
+        
+        Args:
+            rows: List of rows, each a list of column values
+            widths: List of column widths
+            alignments: List of alignments for each column ('left', 'right', 'center')
+            
+        Returns:
+            List of formatted table rows
+        """
+        if alignments is None:
+            alignments = ['left'] * len(widths)
+        
+        if len(widths) != len(alignments):
+            raise ValueError("columns, widths, and alignments must have the same length")
+        
+        try:
+            template = ' '.join(f"{{:{_ALIGN_SPECS[align]}{width}}}" for width, align in zip(widths, alignments))
+        except KeyError as e:
+            raise ValueError(f"Invalid alignment: {e.args[0]}. Use 'left', 'right', or 'center'")
+        
+        formatted_rows = []
+        for columns in rows:
+            columns = [str(col) for col in columns]
+            if len(columns) != len(widths):
+                raise ValueError("columns, widths, and alignments must have the same length")
+            if any('\x1b' in col for col in columns):
+                formatted_rows.append(self.format_table_row(columns, widths, alignments))
+            else:
+                formatted_rows.append(template.format(*columns))
+        
+        return formatted_rows
@@ -4,7 +4,7 @@ Enhanced logging functionality with colorful console output.
 
 import logging
 import sys
-from typing import Optional
+from typing import List, Optional
 from .formatter import ConsoleFormatter
 from .financial_formatter import FinancialFormatter
 from .styles import Colors
@@ -174,6 +174,19 @@ class TickerLogger:
         bullet = self.formatter_helper.format_bullet_point(text, indent)
         print(bullet)
     
+    def print_lines(self, lines: List[str], indent: int = 2) -> None:
+        """
+        Print several bullet points with a single write.
+        
+        Args:
+            lines: Bullet point texts, in display order
+            indent: Indentation level
+        """
+        if not lines:
+            return
+        format_bullet = self.formatter_helper.format_bullet_point
+        sys.stdout.write("\n".join([format_bullet(text, indent) for text in lines]) + "\n")
+    
     def print_command(self, command: str, description: str = "") -> None:
         """
         Print a formatted command with optional description.
@@ -0,0 +1,79 @@
+"""
+Tests for the yearly balance sheet trend analysis.
+"""
+
+import sys
+import os
+import math
+import random
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ticker_analysis.core.analysis import balance_sheet
+from src.ticker_analysis.core.analysis.balance_sheet import BalanceSheetAnalyzer
+from src.ticker_analysis.core.analysis.income_statement import TrendDirection
+from src.ticker_analysis.core.data.fetchers.balance_sheet import BalanceSheetData
+from src.ticker_analysis.core.data.enums import DataFrequency
+
+
+def _yearly(rows):
+    """Build yearly balance sheets from (year, assets, debt, equity) tuples."""
+    return [
+        BalanceSheetData(
+            ticker="TEST",
+            frequency=DataFrequency.YEARLY,
+            period_end_date=f"{year}-12-31",
+            total_assets=assets,
+            total_debt=debt,
+            stockholders_equity=equity
+        )
+        for year, assets, debt, equity in rows
+    ]
+
+
+def test_nan_values_propagate_through_growth_statistics():
+    """A NaN year yields NaN growth rates; None years are skipped instead."""
+    yearly_data = _yearly([
+        (2023, 120.0, 50.0, 60.0),
+        (2022, float("nan"), 45.0, None),
+        (2021, 100.0, 40.0, 50.0),
+    ])
+
+    trends = BalanceSheetAnalyzer().analyze_yearly_trends(yearly_data)
+
+    assert len(trends.assets_growth_rates) == 2
+    assert all(math.isnan(rate) for rate in trends.assets_growth_rates)
+    assert math.isnan(trends.avg_assets_growth)
+    assert trends.assets_trend == TrendDirection.DECLINING
+    assert trends.equity_growth_rates == []
+    assert trends.avg_equity_growth is None
+    assert trends.equity_trend == TrendDirection.INSUFFICIENT_DATA
+    # NaN volatility applies no penalty
+    assert trends.balance_sheet_stability_score == 10.0
+
+
+def test_trend_kernel_matches_list_helpers(monkeypatch):
+    """The compiled-kernel path returns the same statistics as the list helpers."""
+    rnd = random.Random(7)
+
+    def value():
+        r = rnd.random()
+        if r < 0.15:
+            return None
+        if r < 0.25:
+            return 0.0
+        if r < 0.32:
+            return float("nan")
+        return rnd.uniform(-1e9, 1e10)
+
+    analyzer = BalanceSheetAnalyzer()
+    for _ in range(300):
+        yearly_data = _yearly(
+            (2023 - offset, value(), value(), value()) for offset in range(rnd.randint(2, 5))
+        )
+        monkeypatch.setattr(balance_sheet, "NUMBA_AVAILABLE", False)
+        expected = analyzer.analyze_yearly_trends(yearly_data)
+        monkeypatch.setattr(balance_sheet, "NUMBA_AVAILABLE", True)
+        actual = analyzer.analyze_yearly_trends(yearly_data)
+        assert repr(actual) == repr(expected)
@@ -0,0 +1,49 @@
+"""
+Tests for the memoized console financial formatter.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ticker_analysis.interfaces.console.financial_formatter import FinancialFormatter
+
+
+def test_signed_zero_is_independent_of_call_order():
+    """-0.0 and 0.0 compare equal but must not share a cached result."""
+    formatter = FinancialFormatter(use_colors=False)
+
+    assert formatter.format_percentage(-0.0) == "-0.00%"
+    assert formatter.format_percentage(0.0) == "0.00%"
+    assert formatter.format_ratio(-0.0) == "-0.00"
+    assert formatter.format_ratio(0.0) == "0.00"
+
+    # Reverse order on a fresh formatter with the same settings
+    other = FinancialFormatter(use_colors=False)
+    assert other.format_ratio(0.0, precision=3) == "0.000"
+    assert other.format_ratio(-0.0, precision=3) == "-0.000"
+
+
+def test_cache_is_keyed_on_settings():
+    """Formatters with different settings do not share cached strings."""
+    dollars = FinancialFormatter(use_colors=False)
+    euros = FinancialFormatter(use_colors=False, currency_symbol="€")
+
+    assert dollars.format_currency(1234.5) == "$1,234.50"
+    assert euros.format_currency(1234.5) == "€1,234.50"
+    assert FinancialFormatter(use_colors=True).format_ratio(1.5) != dollars.format_ratio(1.5)
+
+
+def test_unhashable_values_format_as_na():
+    """Values float() rejects return N/A instead of failing the cache lookup."""
+    formatter = FinancialFormatter(use_colors=False)
+
+    assert formatter.format_currency([1]) == "N/A"
+    assert formatter.format_percentage({}) == "N/A"
+    assert formatter.format_ratio([1.0, 2.0]) == "N/A"
+    assert formatter.format_currency(np.array([1.0])) == "N/A"
+    assert formatter.format_currency(np.array([1.0, 2.0])) == "N/A"
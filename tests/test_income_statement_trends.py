@@ -0,0 +1,170 @@
+"""
+Tests for the yearly income statement trend analysis.
+"""
+
+import sys
+import os
+import math
+import random
+
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ticker_analysis.core.analysis.income_statement import (
+    CompanyIncomeStatementAnalyzer,
+    IncomeStatementMetrics,
+    TrendDirection,
+    YEARLY_DTYPE
+)
+from src.ticker_analysis.core.data.fetchers.income_statement import IncomeStatementData
+from src.ticker_analysis.core.data.enums import DataFrequency
+
+
+NAN = float("nan")
+AS_OF = "2024-06-30"
+
+
+def _yearly(rows):
+    """Build yearly income statements from (year, revenue, net income, EPS) tuples."""
+    return [
+        IncomeStatementData(
+            ticker="TEST",
+            frequency=DataFrequency.YEARLY,
+            period_end_date=f"{year}-12-31",
+            total_revenue=revenue,
+            net_income=net_income,
+            operating_income=10.0,
+            diluted_eps=eps
+        )
+        for year, revenue, net_income, eps in rows
+    ]
+
+
+def test_nan_values_propagate_through_growth_statistics():
+    """A NaN year yields NaN growth rates; None years are skipped instead."""
+    yearly_data = _yearly([
+        (2023, 120.0, 12.0, 1.2),
+        (2022, NAN, None, 1.1),
+        (2021, 100.0, 10.0, 1.0),
+    ])
+
+    trends = CompanyIncomeStatementAnalyzer().analyze_yearly_trends(yearly_data)
+
+    assert len(trends.revenue_growth_rates) == 2
+    assert all(math.isnan(rate) for rate in trends.revenue_growth_rates)
+    assert math.isnan(trends.avg_revenue_growth)
+    assert math.isnan(trends.revenue_volatility)
+    assert trends.revenue_trend == TrendDirection.DECLINING
+    # NaN volatility applies no penalty
+    assert trends.revenue_consistency_score == 10.0
+    assert trends.net_income_growth_rates == []
+    assert trends.avg_net_income_growth is None
+    assert trends.net_income_trend == TrendDirection.INSUFFICIENT_DATA
+
+
+def _random_yearly(rnd, ticker, allow_nan=True):
+    """Build up to 5 random yearly income statements with None, zero and NaN values."""
+    def value():
+        r = rnd.random()
+        if r < 0.15:
+            return None
+        if r < 0.25:
+            return 0.0
+        if r < 0.32 and allow_nan:
+            return NAN
+        return rnd.choice([rnd.uniform(-1e9, 1e10), rnd.uniform(1e9, 1.1e9)])
+
+    return [
+        IncomeStatementData(
+            ticker=ticker,
+            frequency=DataFrequency.YEARLY,
+            period_end_date=f"{2023 - offset}-12-31",
+            total_revenue=value(),
+            net_income=value(),
+            operating_income=value(),
+            diluted_eps=value(),
+            gross_profit=value(),
+            ebitda=value()
+        )
+        for offset in range(rnd.randint(0, 5))
+    ]
+
+
+def _to_buffer(yearly_data):
+    """Pack income statements into a YEARLY_DTYPE array (NaN for None)."""
+    def field(value):
+        return NAN if value is None else value
+
+    return np.array([
+        (
+            int(data.period_end_date[:4]),
+            field(data.total_revenue),
+            field(data.net_income),
+            field(data.operating_income),
+            field(data.diluted_eps),
+            field(data.gross_profit),
+            field(data.ebitda)
+        )
+        for data in yearly_data
+    ], dtype=YEARLY_DTYPE)
+
+
+def test_batch_trends_match_single_ticker():
+    """analyze_yearly_trends_batch matches analyze_yearly_trends, including None, NaN and one-year inputs."""
+    rnd = random.Random(11)
+    analyzer = CompanyIncomeStatementAnalyzer()
+    yearly_data_list = [_random_yearly(rnd, f"T{i}") for i in range(400)]
+    yearly_data_list += [
+        [],
+        None,
+        _yearly([(2023, 120.0, 12.0, 1.2)]),
+        _yearly([(2023, 120.0, 12.0, 1.2), (2022, NAN, None, 1.1), (2021, 100.0, 10.0, 1.0)]),
+    ]
+
+    batch = analyzer.analyze_yearly_trends_batch(yearly_data_list, as_of=AS_OF)
+
+    assert len(batch) == len(yearly_data_list)
+    for yearly_data, trends in zip(yearly_data_list, batch):
+        expected = analyzer.analyze_yearly_trends(list(yearly_data) if yearly_data else yearly_data, as_of=AS_OF)
+        assert repr(trends) == repr(expected)
+
+
+def test_buffer_trends_match_single_ticker():
+    """analyze_yearly_trends_np reads NaN as a missing value, like None in analyze_yearly_trends."""
+    rnd = random.Random(13)
+    analyzer = CompanyIncomeStatementAnalyzer()
+    for i in range(400):
+        yearly_data = _random_yearly(rnd, f"T{i}", allow_nan=False)
+
+        trends = analyzer.analyze_yearly_trends_np(f"T{i}", _to_buffer(yearly_data), as_of=AS_OF)
+
+        assert repr(trends) == repr(analyzer.analyze_yearly_trends(list(yearly_data), as_of=AS_OF))
+
+    one_year = _to_buffer(_yearly([(2023, 120.0, 12.0, 1.2)]))
+    assert analyzer.analyze_yearly_trends_np("TEST", one_year, as_of=AS_OF) is None
+
+
+def test_batch_assessment_matches_single_ticker():
+    """assess_financial_health_batch matches assess_financial_health, including missing inputs."""
+    rnd = random.Random(17)
+    analyzer = CompanyIncomeStatementAnalyzer()
+    metrics_list = []
+    trends_list = []
+    for i in range(400):
+        trends = analyzer.analyze_yearly_trends(_random_yearly(rnd, f"T{i}"), as_of=AS_OF)
+        metrics = None
+        if rnd.random() < 0.8:
+            metrics = IncomeStatementMetrics(
+                ticker=f"T{i}",
+                net_profit_margin=rnd.choice([None, NAN, 0.0, rnd.uniform(-20.0, 30.0)])
+            )
+        metrics_list.append(metrics)
+        trends_list.append(trends)
+
+    batch = analyzer.assess_financial_health_batch(metrics_list, trends_list, as_of=AS_OF)
+
+    assert len(batch) == len(metrics_list)
+    for metrics, trends, assessment in zip(metrics_list, trends_list, batch):
+        assert repr(assessment) == repr(analyzer.assess_financial_health(metrics, trends, as_of=AS_OF))
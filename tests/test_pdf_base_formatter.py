@@ -0,0 +1,80 @@
+"""
+Tests for the shared PDF formatter helpers.
+"""
+
+import sys
+import os
+import random
+
+import numpy as np
+from reportlab.platypus import Paragraph
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ticker_analysis.core.analysis.pdf.base_formatter import BasePDFFormatter, PDFColors
+from src.ticker_analysis.core.analysis.pdf.array_formatting import (
+    format_currency_array,
+    format_percentage_array,
+    format_volume_array,
+    get_status_color_array
+)
+
+
+def _sample_values():
+    """Values around the compact thresholds and rounding boundaries, plus random ones."""
+    rnd = random.Random(19)
+    values = [0.0, -0.0, 0.004, -0.005, 0.005, 0.125, 999.994, 999.996, 1e3, -1e3,
+              999999.0, 1e6, 1e9, -2.5e9, 1e15, float("inf"), float("-inf")]
+    values += [rnd.uniform(-1.0, 1.0) * 10 ** rnd.randint(-3, 12) for _ in range(500)]
+    return values
+
+
+def _scalar(value):
+    """Map the NaN marker of the array formatters back to the scalar None."""
+    return None if value != value else value
+
+
+def test_array_formatters_match_scalar_formatters():
+    """The array formatters match their scalar versions element by element, NaN matching None."""
+    formatter = BasePDFFormatter()
+    values = _sample_values() + [float("nan")]
+    array = np.array(values)
+
+    for compact in (False, True):
+        for show_sign in (False, True):
+            assert format_currency_array(array, compact=compact, show_sign=show_sign) == [
+                formatter.format_currency(_scalar(v), compact=compact, show_sign=show_sign) for v in values
+            ]
+    for multiply_by_100 in (False, True):
+        for show_sign in (False, True):
+            assert format_percentage_array(
+                array, show_sign=show_sign, multiply_by_100=multiply_by_100
+            ) == [
+                formatter.format_percentage(_scalar(v), show_sign=show_sign, multiply_by_100=multiply_by_100)
+                for v in values
+            ]
+    assert format_volume_array(array) == [formatter.format_volume(_scalar(v)) for v in values]
+    assert format_currency_array(np.array([])) == []
+
+
+def test_status_color_array_matches_scalar():
+    """get_status_color_array matches get_status_color, including NaN and threshold values."""
+    formatter = BasePDFFormatter()
+    values = _sample_values() + [float("nan"), 1.5, 2.0]
+
+    for thresholds in ((2.0, 1.0), (1.0, 2.0), (1.5, 1.5), (-1.0, -5.0)):
+        colors_array = get_status_color_array(np.array(values), thresholds)
+        assert list(colors_array) == [formatter.get_status_color(v, thresholds) for v in values]
+
+
+def test_metric_display_fragments_match_full_parse():
+    """Values that skip the markup parser get the fragments a full parse would produce."""
+    formatter = BasePDFFormatter()
+    style = formatter._metric_display_style()
+
+    for value in ("1.85", "$1.5B", "1.2\u200b", "a  b", " x", "x\ty", "\u200b"):
+        for color in (None, PDFColors.SUCCESS_GREEN):
+            paragraph = formatter.create_metric_display("Current Ratio", value, color)
+            parsed = Paragraph(paragraph.text, style)
+            assert [frag.text for frag in paragraph.frags] == [frag.text for frag in parsed.frags]